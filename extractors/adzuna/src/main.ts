@@ -2,6 +2,7 @@ import { mkdir, writeFile } from "node:fs/promises";
 import { dirname, join } from "node:path";
 import { parseSearchTerms } from "job-ops-shared/utils/search-terms";
 import {
+  parsePositiveInt,
   toNumberOrNull,
   toStringOrNull,
 } from "job-ops-shared/utils/type-conversion";
@@ -40,12 +41,6 @@ type ExtractedJob = {
   jobType?: string;
 };
 
-function parsePositiveInt(input: string | undefined, fallback: number): number {
-  const parsed = input ? Number.parseInt(input, 10) : Number.NaN;
-  if (!Number.isFinite(parsed) || parsed < 1) return fallback;
-  return parsed;
-}
-
 function requireEnv(name: string): string {
   const value = process.env[name]?.trim();
   if (!value) throw new Error(`Missing required environment variable: ${name}`);
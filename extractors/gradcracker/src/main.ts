@@ -1,6 +1,10 @@
 // For more information, see https://crawlee.dev/
 import { launchOptions } from "camoufox-js";
 import { PlaywrightCrawler } from "crawlee";
+import {
+  blockHeavyResources,
+  FIREFOX_USER_PREFS,
+} from "job-ops-shared/utils/browser";
 import { firefox } from "playwright";
 import { initJobOpsProgress } from "./progress.js";
 import { router } from "./routes.js";
@@ -60,6 +64,11 @@ initJobOpsProgress(startUrls.length);
 const crawler = new PlaywrightCrawler({
   // proxyConfiguration: new ProxyConfiguration({ proxyUrls: ['...'] }),
   requestHandler: router,
+  preNavigationHooks: [
+    async ({ page }) => {
+      await blockHeavyResources(page);
+    },
+  ],
   // Comment this option to scrape the full website.
   // maxRequestsPerCrawl: 2000,
   // Add delay between requests to slow down the process
@@ -78,6 +87,7 @@ const crawler = new PlaywrightCrawler({
       headless: true,
       humanize: true,
       geoip: true,
+      firefox_user_prefs: FIREFOX_USER_PREFS,
     }),
   },
 });
@@ -91,8 +91,11 @@ router.addHandler(
     // Wait until the job cards are rendered
     await page.waitForSelector("article[wire\\:key]", { timeout: 10000 });
 
-    // Add delay to see the page load
-    await page.waitForTimeout(3000);
+    // Let Livewire finish hydrating the remaining cards. Capped at the old
+    // fixed delay, but returns as soon as the network goes quiet.
+    await page
+      .waitForLoadState("networkidle", { timeout: 3000 })
+      .catch(() => null);
 
     const toAbsolute = (href: string | null) => {
       if (!href) return null;
@@ -108,7 +111,7 @@ router.addHandler(
     let skippedKnownJobs = 0;
     let enqueuedJobs = 0;
 
-    console.log(`${articles.length} jobs found`);
+    log.info(`${articles.length} jobs found`);
 
     let idx = 1;
     for (const article of articles) {
@@ -116,11 +119,19 @@ router.addHandler(
       const title = (await titleLocator.textContent())?.trim() ?? null;
       const jobUrl = toAbsolute(await titleLocator.getAttribute("href"));
 
+      // The card is already rendered, so a missing logo or link is read as
+      // null straight away instead of waiting out the action timeout.
       const employerImg = article.locator("figure img");
-      const employer = (await employerImg.getAttribute("alt"))?.trim() ?? null;
+      const employer =
+        (await employerImg.count()) > 0
+          ? ((await employerImg.getAttribute("alt"))?.trim() ?? null)
+          : null;
 
       const employerAnchor = article.locator("figure a");
-      const employerUrl = toAbsolute(await employerAnchor.getAttribute("href"));
+      const employerUrl =
+        (await employerAnchor.count()) > 0
+          ? toAbsolute(await employerAnchor.getAttribute("href"))
+          : null;
 
       let disciplines: string | null = null;
       try {
@@ -169,7 +180,9 @@ router.addHandler(
       const degreeRequired = await getDdText("Degree required");
       const starting = await getDdText("Starting");
 
-      console.log(`Got job ${idx}/${articles.length}: ${title}`);
+      // Per-card progress is noisy on long runs; set CRAWLEE_LOG_LEVEL=DEBUG
+      // to see it.
+      log.debug(`Got job ${idx}/${articles.length}: ${title}`);
 
       jobs.push({
         title,
@@ -241,14 +254,11 @@ router.addHandler(
   "gradcracker-single-job-page",
   async ({ page, request, pushData, log }) => {
     const { label, ...jobSummary } = request.userData;
-    log.info(`Processing single job page: ${request.url}`);
+    log.debug(`Processing single job page: ${request.url}`);
 
     // Wait for job content to be present
     await page.waitForSelector(".body-content", { timeout: 10000 });
 
-    // Optional delay if you want to visually see it while debugging
-    await page.waitForTimeout(2000);
-
     const jobDescription =
       (await page.locator(".body-content").textContent())?.trim() || null;
 
@@ -321,14 +331,19 @@ router.addHandler(
             await maybePopup
               .waitForURL((u) => u.toString() !== "about:blank", {
                 timeout: 15000,
+                waitUntil: "commit",
               })
               .catch(() => null);
           }
         } else {
           // Same-tab navigation case.
           await navigationPromise;
+          // Only the new URL is read, so don't wait for the page to load.
           await page
-            .waitForURL((u) => u.toString() !== originalUrl, { timeout: 15000 })
+            .waitForURL((u) => u.toString() !== originalUrl, {
+              timeout: 15000,
+              waitUntil: "commit",
+            })
             .catch(() => null);
         }
 
@@ -339,7 +354,7 @@ router.addHandler(
             `Apply click did not change URL (still Gradcracker): ${applicationLink}`,
           );
         } else {
-          log.info(`Captured application URL: ${applicationLink}`);
+          log.debug(`Captured application URL: ${applicationLink}`);
         }
       } finally {
         // Ensure we don't leak tabs on retries/errors.
@@ -350,7 +365,7 @@ router.addHandler(
     } else if (!hasApplyButton) {
       log.warning(`Apply button not found on page: ${request.url}`);
     } else {
-      log.info(`Skipping apply click for known job: ${request.url}`);
+      log.debug(`Skipping apply click for known job: ${request.url}`);
     }
 
     await pushData({
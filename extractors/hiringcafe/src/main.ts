@@ -2,12 +2,17 @@ import { mkdir, writeFile } from "node:fs/promises";
 import { dirname, join } from "node:path";
 import { fileURLToPath } from "node:url";
 import { launchOptions } from "camoufox-js";
+import {
+  blockHeavyResources,
+  FIREFOX_USER_PREFS,
+} from "job-ops-shared/utils/browser";
 import { parseSearchTerms } from "job-ops-shared/utils/search-terms";
 import {
+  parsePositiveInt,
   toNumberOrNull,
   toStringOrNull,
 } from "job-ops-shared/utils/type-conversion";
-import { firefox, type Page } from "playwright";
+import { type Browser, firefox, type Page } from "playwright";
 import {
   normalizeCountryKey,
   resolveHiringCafeCountryLocation,
@@ -75,12 +80,6 @@ function emitProgress(payload: Record<string, unknown>): void {
   console.log(`${JOBOPS_PROGRESS_PREFIX}${JSON.stringify(payload)}`);
 }
 
-function parsePositiveInt(input: string | undefined, fallback: number): number {
-  const parsed = input ? Number.parseInt(input, 10) : Number.NaN;
-  if (!Number.isFinite(parsed) || parsed < 1) return fallback;
-  return parsed;
-}
-
 function parseWorkplaceTypes(
   raw: string | undefined,
 ): HiringCafeWorkplaceType[] {
@@ -501,6 +500,14 @@ function createCitySearchState(args: {
   };
 }
 
+async function newPage(browser: Browser): Promise<Page> {
+  const context = await browser.newContext();
+  // Searches run through the site's JSON API, so the page only needs its
+  // scripts and cookies.
+  await blockHeavyResources(context);
+  return context.newPage();
+}
+
 async function callHiringCafeApi(
   page: Page,
   endpoint: string,
@@ -595,10 +602,10 @@ async function run(): Promise<void> {
       headless,
       humanize: true,
       geoip: true,
+      firefox_user_prefs: FIREFOX_USER_PREFS,
     }),
   );
-  let context = await browser.newContext();
-  let page = await context.newPage();
+  let page = await newPage(browser);
 
   const allJobs: ExtractedJob[] = [];
   const seen = new Set<string>();
@@ -609,7 +616,11 @@ async function run(): Promise<void> {
         waitUntil: "domcontentloaded",
         timeout: 60_000,
       });
-      await page.waitForTimeout(2_000);
+      // API calls only need the origin's scripts/cookies; stop waiting once
+      // the page has loaded instead of always sleeping the full cap.
+      await page
+        .waitForLoadState("load", { timeout: 2_000 })
+        .catch(() => undefined);
     };
 
     try {
@@ -620,9 +631,11 @@ async function run(): Promise<void> {
         `Camoufox browser startup was unstable, retrying with vanilla Firefox: ${message}`,
       );
       await browser.close();
-      browser = await firefox.launch({ headless });
-      context = await browser.newContext();
-      page = await context.newPage();
+      browser = await firefox.launch({
+        headless,
+        firefoxUserPrefs: FIREFOX_USER_PREFS,
+      });
+      page = await newPage(browser);
       await initializePage();
     }
 
@@ -1,6 +1,7 @@
 import csv
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -87,6 +88,37 @@ def _glassdoor_city_for_country(country_indeed: str, location: str) -> str | Non
     return GLASSDOOR_COUNTRY_TO_CITY.get(country_key)
 
 
+def _dedupe_jobs(jobs: pd.DataFrame) -> pd.DataFrame:
+    """Drop repeated postings, first by URL, then by company/title/location.
+
+    The same listing often comes back from several boards under different
+    URLs; keeping one copy saves a scoring and tailoring pass downstream.
+    The company/title/location match only drops rows from a different board
+    than the first match, since one board can list several openings with the
+    same title at one employer and location.
+    """
+    if jobs.empty:
+        return jobs
+
+    if "job_url" in jobs.columns:
+        has_url = jobs["job_url"].notna()
+        jobs = jobs[~(has_url & jobs["job_url"].duplicated())]
+
+    key_columns = [c for c in ("company", "title", "location") if c in jobs.columns]
+    if len(key_columns) == 3 and "site" in jobs.columns:
+        normalized = jobs[key_columns].fillna("").astype(str)
+        identity = normalized.apply(
+            lambda row: "|".join(" ".join(v.lower().split()) for v in row), axis=1
+        )
+        site = jobs["site"].fillna("").astype(str)
+        first_site = site.groupby(identity).transform("first")
+        # Rows without a company or title are too vague to merge safely.
+        mergeable = (normalized["company"] != "") & (normalized["title"] != "")
+        jobs = jobs[~(mergeable & identity.duplicated() & (site != first_site))]
+
+    return jobs.reset_index(drop=True)
+
+
 def _scrape_for_sites(
     *,
     sites: list[str],
@@ -112,24 +144,33 @@ def _scrape_for_sites(
     return scrape_jobs(**kwargs)
 
 
-def main() -> int:
-    sites = _parse_sites(_env_str("JOBSPY_SITES", "indeed,linkedin"))
-    search_term = _env_str("JOBSPY_SEARCH_TERM", "web developer")
-    location = _env_str("JOBSPY_LOCATION", "UK")
-    results_wanted = _env_int("JOBSPY_RESULTS_WANTED", 200)
-    hours_old = _env_int("JOBSPY_HOURS_OLD", 72)
-    country_indeed = _env_str("JOBSPY_COUNTRY_INDEED", "UK")
-    linkedin_fetch_description = _env_bool("JOBSPY_LINKEDIN_FETCH_DESCRIPTION", True)
-    is_remote = _env_bool("JOBSPY_IS_REMOTE", False)
-    term_index = _env_int("JOBSPY_TERM_INDEX", 1)
-    term_total = _env_int("JOBSPY_TERM_TOTAL", 1)
+def _load_batch() -> list[dict]:
+    raw = os.getenv("JOBSPY_BATCH")
+    if raw is None or raw.strip() == "":
+        return []
+    runs = json.loads(raw)
+    if not isinstance(runs, list):
+        raise ValueError("JOBSPY_BATCH must be a JSON array")
+    return runs
 
-    output_csv = Path(_env_str("JOBSPY_OUTPUT_CSV", "jobs.csv"))
-    output_json = Path(
-        _env_str("JOBSPY_OUTPUT_JSON", str(output_csv.with_suffix(".json")))
-    )
 
-    output_csv.parent.mkdir(parents=True, exist_ok=True)
+def _run_search(
+    *,
+    search_term: str,
+    location: str,
+    term_index: int,
+    term_total: int,
+    output_csv: Path | None,
+    output_json: Path,
+    sites: list[str],
+    results_wanted: int,
+    hours_old: int,
+    country_indeed: str,
+    linkedin_fetch_description: bool,
+    is_remote: bool,
+) -> None:
+    if output_csv is not None:
+        output_csv.parent.mkdir(parents=True, exist_ok=True)
     output_json.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"jobspy: Search term: {search_term}")
@@ -141,22 +182,14 @@ def main() -> int:
             "searchTerm": search_term,
         },
     )
-    frames: list[pd.DataFrame] = []
+    # jobspy already scrapes the sites of a single call concurrently, but
+    # Glassdoor needs its own call (different location), so run the calls in
+    # parallel instead of waiting for one before starting the next.
+    site_groups: list[tuple[list[str], str]] = []
     non_glassdoor_sites = [site for site in sites if site != "glassdoor"]
 
     if non_glassdoor_sites:
-        frames.append(
-            _scrape_for_sites(
-                sites=non_glassdoor_sites,
-                search_term=search_term,
-                location=location,
-                results_wanted=results_wanted,
-                hours_old=hours_old,
-                country_indeed=country_indeed,
-                linkedin_fetch_description=linkedin_fetch_description,
-                is_remote=is_remote,
-            )
-        )
+        site_groups.append((non_glassdoor_sites, location))
 
     if "glassdoor" in sites:
         glassdoor_location = location
@@ -173,20 +206,34 @@ def main() -> int:
                 print(
                     "jobspy: Glassdoor location matched country; keeping original location"
                 )
-        frames.append(
-            _scrape_for_sites(
-                sites=["glassdoor"],
-                search_term=search_term,
-                location=glassdoor_location,
-                results_wanted=results_wanted,
-                hours_old=hours_old,
-                country_indeed=country_indeed,
-                linkedin_fetch_description=linkedin_fetch_description,
-                is_remote=is_remote,
-            )
-        )
+        site_groups.append((["glassdoor"], glassdoor_location))
+
+    frames: list[pd.DataFrame] = []
+    if site_groups:
+        max_workers = max(1, _env_int("JOBSPY_CONCURRENCY", len(site_groups)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _scrape_for_sites,
+                    sites=group_sites,
+                    search_term=search_term,
+                    location=group_location,
+                    results_wanted=results_wanted,
+                    hours_old=hours_old,
+                    country_indeed=country_indeed,
+                    linkedin_fetch_description=linkedin_fetch_description,
+                    is_remote=is_remote,
+                )
+                for group_sites, group_location in site_groups
+            ]
+            # Collect in submission order so output ordering stays stable.
+            frames = [future.result() for future in futures]
 
     jobs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    scraped_count = len(jobs)
+    jobs = _dedupe_jobs(jobs)
+    if len(jobs) < scraped_count:
+        print(f"jobspy: Dropped {scraped_count - len(jobs)} duplicate jobs")
 
     print(f"Found {len(jobs)} jobs")
     _emit_progress(
@@ -199,16 +246,61 @@ def main() -> int:
         },
     )
 
-    jobs.to_csv(
-        output_csv,
-        quoting=csv.QUOTE_NONNUMERIC,
-        escapechar="\\",
-        index=False,
-    )
-    jobs.to_json(output_json, orient="records", force_ascii=False)
+    if output_csv is not None:
+        jobs.to_csv(
+            output_csv,
+            quoting=csv.QUOTE_NONNUMERIC,
+            escapechar="\\",
+            index=False,
+        )
+        print(f"Wrote CSV:  {output_csv}")
 
-    print(f"Wrote CSV:  {output_csv}")
+    jobs.to_json(output_json, orient="records", force_ascii=False)
     print(f"Wrote JSON: {output_json}")
+
+
+def main() -> int:
+    search_settings = {
+        "sites": _parse_sites(_env_str("JOBSPY_SITES", "indeed,linkedin")),
+        "results_wanted": _env_int("JOBSPY_RESULTS_WANTED", 200),
+        "hours_old": _env_int("JOBSPY_HOURS_OLD", 72),
+        "country_indeed": _env_str("JOBSPY_COUNTRY_INDEED", "UK"),
+        "linkedin_fetch_description": _env_bool(
+            "JOBSPY_LINKEDIN_FETCH_DESCRIPTION", True
+        ),
+        "is_remote": _env_bool("JOBSPY_IS_REMOTE", False),
+    }
+
+    # A batch runs every search term/location pair in this one process, so
+    # the interpreter, pandas and jobspy start once instead of once per run.
+    batch = _load_batch()
+    if batch:
+        for index, run in enumerate(batch, start=1):
+            output_csv = run.get("outputCsv")
+            _run_search(
+                search_term=run.get("searchTerm") or "web developer",
+                location=run.get("location") or "UK",
+                term_index=index,
+                term_total=len(batch),
+                output_csv=Path(output_csv) if output_csv else None,
+                output_json=Path(run["outputJson"]),
+                **search_settings,
+            )
+        return 0
+
+    output_csv = Path(_env_str("JOBSPY_OUTPUT_CSV", "jobs.csv"))
+    output_json = Path(
+        _env_str("JOBSPY_OUTPUT_JSON", str(output_csv.with_suffix(".json")))
+    )
+    _run_search(
+        search_term=_env_str("JOBSPY_SEARCH_TERM", "web developer"),
+        location=_env_str("JOBSPY_LOCATION", "UK"),
+        term_index=_env_int("JOBSPY_TERM_INDEX", 1),
+        term_total=_env_int("JOBSPY_TERM_TOTAL", 1),
+        output_csv=output_csv if _env_bool("JOBSPY_WRITE_CSV", True) else None,
+        output_json=output_json,
+        **search_settings,
+    )
     return 0
 
 
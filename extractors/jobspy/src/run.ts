@@ -7,6 +7,7 @@ import { fileURLToPath } from "node:url";
 import { resolveSearchCities } from "@shared/search-cities.js";
 import type { CreateJobInput, JobSource } from "@shared/types/jobs";
 import {
+  toBooleanOrNull,
   toNumberOrNull,
   toStringOrNull,
 } from "@shared/utils/type-conversion.js";
@@ -65,19 +66,6 @@ export function parseJobSpyProgressLine(
   return null;
 }
 
-function toBooleanOrNull(value: unknown): boolean | null {
-  if (value === null || value === undefined) return null;
-  if (typeof value === "boolean") return value;
-  if (typeof value === "number") return value !== 0;
-  if (typeof value === "string") {
-    const normalized = value.trim().toLowerCase();
-    if (!normalized) return null;
-    if (["1", "true", "yes", "y", "on"].includes(normalized)) return true;
-    if (["0", "false", "no", "n", "off"].includes(normalized)) return false;
-  }
-  return null;
-}
-
 function toJsonStringOrNull(value: unknown): string | null {
   if (value === null || value === undefined) return null;
   if (typeof value === "string") return toStringOrNull(value);
@@ -176,117 +164,98 @@ export async function runJobSpy(
     return { success: true, jobs: [] };
   }
 
+  // One Python process handles every term/location pair, so interpreter,
+  // pandas and jobspy startup is paid once per extractor run.
+  const batch = buildJobSpyBatch(searchTerms, locations, OUTPUT_DIR);
+
   try {
     const jobs: CreateJobInput[] = [];
     const seenJobUrls = new Set<string>();
-    const totalRuns = searchTerms.length * locations.length;
-    let runIndex = 0;
-
-    for (const searchTerm of searchTerms) {
-      for (const location of locations) {
-        runIndex += 1;
-        const suffix = `${runIndex}_${slugForFilename(searchTerm)}_${slugForFilename(location)}`;
-        const outputCsv = join(OUTPUT_DIR, `jobspy_jobs_${suffix}.csv`);
-        const outputJson = join(OUTPUT_DIR, `jobspy_jobs_${suffix}.json`);
-
-        await new Promise<void>((resolve, reject) => {
-          // Auto-detect venv if present, so contributors don't need to set
-          // PYTHON_PATH manually. The venv is created once with:
-          //   python3 -m venv .venv && .venv/bin/pip install -r requirements.txt
-          // In Docker, PYTHON_PATH is set explicitly to /usr/bin/python3.
-          const venvPython = join(
-            EXTRACTOR_DIR,
-            ".venv",
-            process.platform === "win32" ? "Scripts/python.exe" : "bin/python3",
-          );
-          const pythonPath = process.env.PYTHON_PATH
-            ? process.env.PYTHON_PATH
-            : existsSync(venvPython)
-              ? venvPython
-              : process.platform === "win32"
-                ? "python"
-                : "python3";
-
-          const child = spawn(pythonPath, [JOBSPY_SCRIPT], {
-            cwd: EXTRACTOR_DIR,
-            shell: false,
-            stdio: ["ignore", "pipe", "pipe"],
-            env: {
-              ...process.env,
-              JOBSPY_SITES: sites || "indeed,linkedin,glassdoor",
-              JOBSPY_SEARCH_TERM: searchTerm,
-              JOBSPY_TERM_INDEX: String(runIndex),
-              JOBSPY_TERM_TOTAL: String(totalRuns),
-              JOBSPY_LOCATION: location,
-              JOBSPY_RESULTS_WANTED: String(
-                options.resultsWanted ??
-                  process.env.JOBSPY_RESULTS_WANTED ??
-                  200,
-              ),
-              JOBSPY_HOURS_OLD: String(
-                options.hoursOld ?? process.env.JOBSPY_HOURS_OLD ?? 72,
-              ),
-              JOBSPY_COUNTRY_INDEED: countryIndeed,
-              JOBSPY_LINKEDIN_FETCH_DESCRIPTION: String(
-                options.linkedinFetchDescription ??
-                  process.env.JOBSPY_LINKEDIN_FETCH_DESCRIPTION ??
-                  "1",
-              ),
-              JOBSPY_IS_REMOTE: String(
-                options.isRemote ??
-                  deriveIsRemoteFlag(options.workplaceTypes) ??
-                  process.env.JOBSPY_IS_REMOTE ??
-                  "0",
-              ),
-              JOBSPY_OUTPUT_CSV: outputCsv,
-              JOBSPY_OUTPUT_JSON: outputJson,
-            },
-          });
-
-          const handleLine = (line: string, stream: NodeJS.WriteStream) => {
-            const event = parseJobSpyProgressLine(line);
-            if (event) {
-              options.onProgress?.(event);
-              return;
-            }
-            stream.write(`${line}\n`);
-          };
-
-          const stdoutRl = child.stdout
-            ? createInterface({ input: child.stdout })
-            : null;
-          const stderrRl = child.stderr
-            ? createInterface({ input: child.stderr })
-            : null;
-
-          stdoutRl?.on("line", (line) => handleLine(line, process.stdout));
-          stderrRl?.on("line", (line) => handleLine(line, process.stderr));
-
-          child.on("close", (code) => {
-            stdoutRl?.close();
-            stderrRl?.close();
-            if (code === 0) resolve();
-            else reject(new Error(`JobSpy exited with code ${code}`));
-          });
-          child.on("error", reject);
-        });
-
-        const raw = await readFile(outputJson, "utf-8");
-        const parsed = JSON.parse(raw) as Array<Record<string, unknown>>;
-        const filtered = mapJobSpyRows(parsed);
-
-        for (const job of filtered) {
-          if (seenJobUrls.has(job.jobUrl)) continue;
-          seenJobUrls.add(job.jobUrl);
-          jobs.push(job);
-        }
 
-        try {
-          await unlink(outputJson);
-          await unlink(outputCsv);
-        } catch {
-          // ignore cleanup errors
+    await new Promise<void>((resolve, reject) => {
+      // Auto-detect venv if present, so contributors don't need to set
+      // PYTHON_PATH manually. The venv is created once with:
+      //   python3 -m venv .venv && .venv/bin/pip install -r requirements.txt
+      // In Docker, PYTHON_PATH is set explicitly to /usr/bin/python3.
+      const venvPython = join(
+        EXTRACTOR_DIR,
+        ".venv",
+        process.platform === "win32" ? "Scripts/python.exe" : "bin/python3",
+      );
+      const pythonPath = process.env.PYTHON_PATH
+        ? process.env.PYTHON_PATH
+        : existsSync(venvPython)
+          ? venvPython
+          : process.platform === "win32"
+            ? "python"
+            : "python3";
+
+      const child = spawn(pythonPath, [JOBSPY_SCRIPT], {
+        cwd: EXTRACTOR_DIR,
+        shell: false,
+        stdio: ["ignore", "pipe", "pipe"],
+        env: {
+          ...process.env,
+          JOBSPY_SITES: sites || "indeed,linkedin,glassdoor",
+          JOBSPY_BATCH: JSON.stringify(batch),
+          JOBSPY_RESULTS_WANTED: String(
+            options.resultsWanted ?? process.env.JOBSPY_RESULTS_WANTED ?? 200,
+          ),
+          JOBSPY_HOURS_OLD: String(
+            options.hoursOld ?? process.env.JOBSPY_HOURS_OLD ?? 72,
+          ),
+          JOBSPY_COUNTRY_INDEED: countryIndeed,
+          JOBSPY_LINKEDIN_FETCH_DESCRIPTION: String(
+            options.linkedinFetchDescription ??
+              process.env.JOBSPY_LINKEDIN_FETCH_DESCRIPTION ??
+              "1",
+          ),
+          JOBSPY_IS_REMOTE: String(
+            options.isRemote ??
+              deriveIsRemoteFlag(options.workplaceTypes) ??
+              process.env.JOBSPY_IS_REMOTE ??
+              "0",
+          ),
+        },
+      });
+
+      const handleLine = (line: string, stream: NodeJS.WriteStream) => {
+        const event = parseJobSpyProgressLine(line);
+        if (event) {
+          options.onProgress?.(event);
+          return;
         }
+        stream.write(`${line}\n`);
+      };
+
+      const stdoutRl = child.stdout
+        ? createInterface({ input: child.stdout })
+        : null;
+      const stderrRl = child.stderr
+        ? createInterface({ input: child.stderr })
+        : null;
+
+      stdoutRl?.on("line", (line) => handleLine(line, process.stdout));
+      stderrRl?.on("line", (line) => handleLine(line, process.stderr));
+
+      child.on("close", (code) => {
+        stdoutRl?.close();
+        stderrRl?.close();
+        if (code === 0) resolve();
+        else reject(new Error(`JobSpy exited with code ${code}`));
+      });
+      child.on("error", reject);
+    });
+
+    for (const { outputJson } of batch) {
+      const raw = await readFile(outputJson, "utf-8");
+      const parsed = JSON.parse(raw) as Array<Record<string, unknown>>;
+      const filtered = mapJobSpyRows(parsed);
+
+      for (const job of filtered) {
+        if (seenJobUrls.has(job.jobUrl)) continue;
+        seenJobUrls.add(job.jobUrl);
+        jobs.push(job);
       }
     }
 
@@ -294,9 +263,36 @@ export async function runJobSpy(
   } catch (error) {
     const message = error instanceof Error ? error.message : "Unknown error";
     return { success: false, jobs: [], error: message };
+  } finally {
+    // A failed run can leave files from the pairs that finished before it.
+    await Promise.all(
+      batch.map(({ outputJson }) =>
+        unlink(outputJson).catch(() => {
+          // ignore cleanup errors
+        }),
+      ),
+    );
   }
 }
 
+export function buildJobSpyBatch(
+  searchTerms: string[],
+  locations: string[],
+  outputDir: string,
+): Array<{ searchTerm: string; location: string; outputJson: string }> {
+  return searchTerms.flatMap((searchTerm, termOffset) =>
+    locations.map((location, locationOffset) => {
+      const runIndex = termOffset * locations.length + locationOffset + 1;
+      const suffix = `${runIndex}_${slugForFilename(searchTerm)}_${slugForFilename(location)}`;
+      return {
+        searchTerm,
+        location,
+        outputJson: join(outputDir, `jobspy_jobs_${suffix}.json`),
+      };
+    }),
+  );
+}
+
 function resolveSearchTerms(options: RunJobSpyOptions): string[] {
   const fromOptions = options.searchTerms?.length ? options.searchTerms : null;
   const fromEnv = parseSearchTermsEnv(process.env.JOBSPY_SEARCH_TERMS);
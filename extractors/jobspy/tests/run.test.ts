@@ -1,5 +1,9 @@
 import { describe, expect, it } from "vitest";
-import { deriveIsRemoteFlag, parseJobSpyProgressLine } from "../src/run";
+import {
+  buildJobSpyBatch,
+  deriveIsRemoteFlag,
+  parseJobSpyProgressLine,
+} from "../src/run";
 
 describe("parseJobSpyProgressLine", () => {
   it("parses term_start progress lines", () => {
@@ -49,3 +53,24 @@ describe("parseJobSpyProgressLine", () => {
     expect(deriveIsRemoteFlag(["remote", "hybrid", "onsite"])).toBeUndefined();
   });
 });
+
+describe("buildJobSpyBatch", () => {
+  it("creates one run per search term and location in run order", () => {
+    const batch = buildJobSpyBatch(
+      ["web developer", "QA"],
+      ["London", "Leeds"],
+      "/tmp/imports",
+    );
+
+    expect(
+      batch.map(({ searchTerm, location }) => [searchTerm, location]),
+    ).toEqual([
+      ["web developer", "London"],
+      ["web developer", "Leeds"],
+      ["QA", "London"],
+      ["QA", "Leeds"],
+    ]);
+    expect(new Set(batch.map((run) => run.outputJson)).size).toBe(4);
+    expect(batch[0]?.outputJson.startsWith("/tmp/imports/")).toBe(true);
+  });
+});
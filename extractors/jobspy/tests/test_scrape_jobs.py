@@ -0,0 +1,77 @@
+import sys
+import types
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# _dedupe_jobs does not scrape, so the tests run without python-jobspy.
+sys.modules.setdefault("jobspy", types.SimpleNamespace(scrape_jobs=None))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scrape_jobs import _dedupe_jobs  # noqa: E402
+
+
+def _job(site: str, url: str, title: str = "Software Engineer", **fields):
+    return {
+        "site": site,
+        "job_url": url,
+        "company": "Acme",
+        "title": title,
+        "location": "London, UK",
+        **fields,
+    }
+
+
+class DedupeJobsTest(unittest.TestCase):
+    def test_drops_repeated_urls(self):
+        jobs = pd.DataFrame(
+            [
+                _job("indeed", "https://indeed.com/1"),
+                _job("indeed", "https://indeed.com/1"),
+            ]
+        )
+
+        self.assertEqual(len(_dedupe_jobs(jobs)), 1)
+
+    def test_drops_the_same_posting_from_another_board(self):
+        jobs = pd.DataFrame(
+            [
+                _job("indeed", "https://indeed.com/1"),
+                _job("linkedin", "https://linkedin.com/1", location="london,  uk"),
+            ]
+        )
+
+        deduped = _dedupe_jobs(jobs)
+
+        self.assertEqual(deduped["site"].tolist(), ["indeed"])
+
+    def test_keeps_same_title_openings_on_one_board(self):
+        jobs = pd.DataFrame(
+            [
+                _job("indeed", "https://indeed.com/1"),
+                _job("indeed", "https://indeed.com/2"),
+                _job("linkedin", "https://linkedin.com/1"),
+            ]
+        )
+
+        deduped = _dedupe_jobs(jobs)
+
+        self.assertEqual(
+            deduped["job_url"].tolist(),
+            ["https://indeed.com/1", "https://indeed.com/2"],
+        )
+
+    def test_keeps_rows_without_company_or_title(self):
+        jobs = pd.DataFrame(
+            [
+                _job("indeed", "https://indeed.com/1", company=None),
+                _job("linkedin", "https://linkedin.com/1", company=None),
+            ]
+        )
+
+        self.assertEqual(len(_dedupe_jobs(jobs)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,16 +11,22 @@
  *   UKVISAJOBS_MAX_JOBS - Maximum jobs to fetch (default: 50, max: 200) - Set via UI Settings
  *   UKVISAJOBS_SEARCH_KEYWORD - Optional search filter
  *   UKVISAJOBS_REFRESH_ONLY - Set to "1" to refresh tokens and exit
+ *   UKVISAJOBS_BROWSER_STATE_TTL_HOURS - Max age of the saved browser session
+ *     before the login form is filled again (default: 24, 0 disables reuse)
  */
 
-import { mkdir, readFile, writeFile } from "node:fs/promises";
+import { mkdir, readFile, stat, writeFile } from "node:fs/promises";
 import { dirname, join } from "node:path";
 import { fileURLToPath } from "node:url";
+import {
+  blockHeavyResources,
+  FIREFOX_USER_PREFS,
+} from "job-ops-shared/utils/browser";
 import {
   toNumberOrNull,
   toStringOrNull,
 } from "job-ops-shared/utils/type-conversion";
-import type { Request } from "playwright";
+import type { Page, Request } from "playwright";
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 
@@ -29,6 +35,16 @@ const SIGNIN_URL = "https://my.ukvisajobs.com/signin";
 const OPEN_JOBS_URL =
   "https://my.ukvisajobs.com/open-jobs/1?is_global=0&sortBy=desc&visaAcceptance=false&applicants_outside_uk=false&pageNo=1";
 const AUTH_CACHE_PATH = join(__dirname, "../storage/ukvisajobs-auth.json");
+const BROWSER_STATE_PATH = join(
+  __dirname,
+  "../storage/ukvisajobs-browser-state.json",
+);
+const DEFAULT_BROWSER_STATE_TTL_HOURS = 24;
+// Cap implicit auto-waits such as filling the login form, while navigations
+// keep Playwright's 30s default (setDefaultTimeout would otherwise apply to
+// them too).
+const DEFAULT_ACTION_TIMEOUT_MS = 10_000;
+const DEFAULT_NAVIGATION_TIMEOUT_MS = 30_000;
 const JOBS_PER_PAGE = 15;
 const DEFAULT_MAX_JOBS = 50;
 const MAX_ALLOWED_JOBS = 200;
@@ -328,9 +344,53 @@ function isAuthErrorResponse(status: number, bodyText: string): boolean {
   return bodyText.toLowerCase().includes("expired");
 }
 
+async function resolveBrowserStatePath(): Promise<string | undefined> {
+  const ttlHours =
+    toNumberOrNull(process.env.UKVISAJOBS_BROWSER_STATE_TTL_HOURS) ??
+    DEFAULT_BROWSER_STATE_TTL_HOURS;
+  if (ttlHours <= 0) return undefined;
+
+  try {
+    const { mtimeMs } = await stat(BROWSER_STATE_PATH);
+    if (Date.now() - mtimeMs > ttlHours * 60 * 60 * 1000) return undefined;
+    return BROWSER_STATE_PATH;
+  } catch (_error) {
+    return undefined;
+  }
+}
+
+function isSignInUrl(url: string): boolean {
+  try {
+    return new URL(url).pathname.startsWith("/signin");
+  } catch (_error) {
+    return false;
+  }
+}
+
+async function signIn(
+  page: Page,
+  email: string,
+  password: string,
+): Promise<void> {
+  await page.goto(SIGNIN_URL, { waitUntil: "domcontentloaded" });
+  await page.waitForSelector("#email", { timeout: 15000 });
+  await page.fill("#email", email);
+  await page.fill("#password", password);
+  await page.keyboard.press("Enter");
+  // Continue as soon as the sign-in redirect happens; a failed login is
+  // reported by the caller when no auth token can be found.
+  await page
+    .waitForURL((url) => !isSignInUrl(url.toString()), {
+      timeout: 15000,
+      waitUntil: "commit",
+    })
+    .catch(() => null);
+}
+
 async function loginWithBrowser(
   email: string,
   password: string,
+  rejectedToken?: string | null,
 ): Promise<UkVisaJobsAuthSession> {
   const [{ launchOptions }, { firefox }] = await Promise.all([
     import("camoufox-js"),
@@ -342,34 +402,60 @@ async function loginWithBrowser(
       headless,
       humanize: true,
       geoip: true,
+      firefox_user_prefs: FIREFOX_USER_PREFS,
     }),
   );
-  const context = await browser.newContext();
+  const storageState = await resolveBrowserStatePath();
+  const context = await browser.newContext(
+    storageState ? { storageState } : {},
+  );
+  // The login flow only needs the form and the site's scripts.
+  await blockHeavyResources(context);
   const page = await context.newPage();
-
-  try {
-    await page.goto(SIGNIN_URL, { waitUntil: "domcontentloaded" });
-    await page.waitForSelector("#email", { timeout: 15000 });
-    await page.fill("#email", email);
-    await page.fill("#password", password);
-    await page.keyboard.press("Enter");
-    await page.waitForTimeout(7000);
-
-    const requestPromise = page.waitForRequest(
-      (request) =>
-        request.url().includes("/ukvisa-api/api/fetch-jobs-data") &&
-        request.method() === "POST",
-      { timeout: 30000 },
-    );
+  page.setDefaultTimeout(DEFAULT_ACTION_TIMEOUT_MS);
+  page.setDefaultNavigationTimeout(DEFAULT_NAVIGATION_TIMEOUT_MS);
+
+  const openJobsPage = async (): Promise<Request | null> => {
+    const requestPromise = page
+      .waitForRequest(
+        (request) =>
+          request.url().includes("/ukvisa-api/api/fetch-jobs-data") &&
+          request.method() === "POST",
+        { timeout: 30000 },
+      )
+      .catch(() => null);
 
     await page.goto(OPEN_JOBS_URL, { waitUntil: "networkidle" });
-    await page.waitForTimeout(5000);
+    // Without a session the site bounces to the sign-in page, so there is no
+    // jobs request to wait for.
+    if (isSignInUrl(page.url())) return null;
+    return requestPromise;
+  };
+
+  // The saved session was stored alongside the token the API may just have
+  // rejected, so only trust it when the page gets a different, accepted token.
+  const isFreshSession = async (request: Request | null): Promise<boolean> => {
+    if (!request) return false;
+    const token = extractTokenFromRequest(request);
+    if (!token || token === rejectedToken) return false;
+    const response = await request.response().catch(() => null);
+    if (!response) return false;
+    const body = await response.text().catch(() => "");
+    return !isAuthErrorResponse(response.status(), body);
+  };
 
-    let fetchRequest: Request | null = null;
-    try {
-      fetchRequest = await requestPromise;
-    } catch (_error) {
-      fetchRequest = null;
+  try {
+    // A saved browser session usually outlives the API token, so try it
+    // before filling in the login form again.
+    let fetchRequest = storageState ? await openJobsPage() : null;
+    let signedIn = false;
+    if (!(await isFreshSession(fetchRequest))) {
+      if (storageState) {
+        console.log("   Saved browser session expired. Signing in...");
+      }
+      await signIn(page, email, password);
+      signedIn = true;
+      fetchRequest = await openJobsPage();
     }
 
     const cookies = await context.cookies("https://my.ukvisajobs.com");
@@ -387,6 +473,13 @@ async function loginWithBrowser(
       throw new Error("Failed to locate auth token from browser session.");
     }
 
+    // Only a form sign-in refreshes the saved state, so its age (checked
+    // against UKVISAJOBS_BROWSER_STATE_TTL_HOURS) is the time since login.
+    if (signedIn) {
+      await mkdir(dirname(BROWSER_STATE_PATH), { recursive: true });
+      await context.storageState({ path: BROWSER_STATE_PATH });
+    }
+
     return {
       token,
       authToken: authToken || token,
@@ -419,6 +512,7 @@ async function main(): Promise<void> {
     authSession = await loginWithBrowser(
       credentials.email,
       credentials.password,
+      authSession?.token,
     );
     await saveCachedAuthSession(authSession);
     console.log("   Auth session refreshed.");
@@ -490,6 +584,7 @@ async function main(): Promise<void> {
         authSession = await loginWithBrowser(
           credentials.email,
           credentials.password,
+          authSession.token,
         );
         await saveCachedAuthSession(authSession);
         response = await fetchPage(pageNo, authSession, { searchKeyword });
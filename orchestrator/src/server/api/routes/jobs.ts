@@ -37,6 +37,7 @@ import { scoreJobSuitability } from "@server/services/scorer";
 import { getTracerReadiness } from "@server/services/tracer-links";
 import * as visaSponsors from "@server/services/visa-sponsors/index";
 import { asyncPool } from "@server/utils/async-pool";
+import { discardResponseBody } from "@server/utils/fetch";
 import {
   APPLICATION_OUTCOMES,
   APPLICATION_STAGES,
@@ -107,6 +108,8 @@ async function notifyJobCompleteWebhook(job: Job) {
         response: (await response.text().catch(() => "")).slice(0, 200),
         jobId: job.id,
       });
+    } else {
+      await discardResponseBody(response);
     }
   } catch (error) {
     logger.warn("Job complete webhook POST failed", { jobId: job.id, error });
@@ -139,7 +139,8 @@ export async function runPipeline(
 
       const { processedCount } = await processJobsStep({
         jobsToProcess,
-        processJob,
+        summarizeJob,
+        generateFinalPdf,
         shouldCancel: () => cancelRequestedAt !== null,
       });
       jobsProcessed = processedCount;
@@ -255,6 +256,11 @@ export async function summarizeJob(
         const tailoringResult = await generateTailoring(
           job.jobDescription || "",
           profile,
+          {
+            bypassCache: options?.force,
+            jobTitle: job.title,
+            employer: job.employer,
+          },
         );
         if (tailoringResult.success && tailoringResult.data) {
           tailoredSummary = tailoringResult.data.summary;
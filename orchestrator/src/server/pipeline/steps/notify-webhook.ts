@@ -1,6 +1,7 @@
 import { logger } from "@infra/logger";
 import { sanitizeWebhookPayload } from "@infra/sanitize";
 import * as settingsRepo from "@server/repositories/settings";
+import { discardResponseBody } from "@server/utils/fetch";
 
 export async function notifyPipelineWebhookStep(
   event: "pipeline.completed" | "pipeline.failed",
@@ -46,6 +47,8 @@ export async function notifyPipelineWebhookStep(
         status: response.status,
         error: responseText.slice(0, 200),
       });
+    } else {
+      await discardResponseBody(response);
     }
   } catch (error) {
     logger.warn("Pipeline webhook POST failed", error);
@@ -0,0 +1,116 @@
+import { createJob } from "@shared/testing/factories";
+import { beforeEach, describe, expect, it, vi } from "vitest";
+import { processJobsStep } from "./process-jobs";
+import type { ScoredJob } from "./types";
+
+vi.mock("@infra/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+  },
+}));
+
+vi.mock("../progress", () => ({
+  updateProgress: vi.fn(),
+  progressHelpers: {
+    processingJob: vi.fn(),
+    jobComplete: vi.fn(),
+  },
+}));
+
+const toScoredJobs = (ids: string[]): ScoredJob[] =>
+  ids.map((id) => ({
+    ...createJob({ id }),
+    suitabilityScore: 80,
+    suitabilityReason: "match",
+  }));
+
+describe("processJobsStep", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it("keeps summarizing while earlier PDFs are still rendering", async () => {
+    let releasePdfs: () => void = () => undefined;
+    const pdfsBlocked = new Promise<void>((resolve) => {
+      releasePdfs = resolve;
+    });
+    const summarizeJob = vi.fn(async () => ({ success: true }));
+    const generateFinalPdf = vi.fn(async () => {
+      await pdfsBlocked;
+      return { success: true };
+    });
+
+    const pending = processJobsStep({
+      jobsToProcess: toScoredJobs(["a", "b", "c", "d", "e"]),
+      summarizeJob,
+      generateFinalPdf,
+    });
+
+    await vi.waitFor(() => expect(summarizeJob).toHaveBeenCalledTimes(5));
+    expect(generateFinalPdf).toHaveBeenCalledTimes(3);
+
+    releasePdfs();
+    const result = await pending;
+
+    expect(generateFinalPdf).toHaveBeenCalledTimes(5);
+    expect(result).toEqual({ processedCount: 5 });
+  });
+
+  it("skips queued PDF renders once the run is cancelled", async () => {
+    let cancelled = false;
+    let releasePdfs: () => void = () => undefined;
+    const pdfsBlocked = new Promise<void>((resolve) => {
+      releasePdfs = resolve;
+    });
+    const summarizeJob = vi.fn(async () => ({ success: true }));
+    const generateFinalPdf = vi.fn(async (_jobId: string) => {
+      await pdfsBlocked;
+      return { success: true };
+    });
+
+    const pending = processJobsStep({
+      jobsToProcess: toScoredJobs(["a", "b", "c", "d", "e"]),
+      summarizeJob,
+      generateFinalPdf,
+      shouldCancel: () => cancelled,
+    });
+
+    await vi.waitFor(() => expect(summarizeJob).toHaveBeenCalledTimes(5));
+    cancelled = true;
+    releasePdfs();
+    const result = await pending;
+
+    expect(generateFinalPdf.mock.calls.map(([jobId]) => jobId)).toEqual([
+      "a",
+      "b",
+      "c",
+    ]);
+    expect(result).toEqual({ processedCount: 3 });
+  });
+
+  it("skips the PDF for jobs whose summary failed", async () => {
+    const summarizeJob = vi.fn(async (jobId: string) =>
+      jobId === "b"
+        ? { success: false, error: "Tailoring failed" }
+        : { success: true },
+    );
+    const generateFinalPdf = vi.fn(async (jobId: string) => {
+      if (jobId === "c") throw new Error("render crashed");
+      return { success: true };
+    });
+
+    const result = await processJobsStep({
+      jobsToProcess: toScoredJobs(["a", "b", "c"]),
+      summarizeJob,
+      generateFinalPdf,
+    });
+
+    expect(generateFinalPdf.mock.calls.map(([jobId]) => jobId)).toEqual([
+      "a",
+      "c",
+    ]);
+    expect(result).toEqual({ processedCount: 1 });
+  });
+});
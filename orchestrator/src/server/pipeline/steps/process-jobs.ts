@@ -1,17 +1,35 @@
 import { logger } from "@infra/logger";
-import { asyncPool } from "@server/utils/async-pool";
+import { asyncPool, createConcurrencyLimiter } from "@server/utils/async-pool";
 import { progressHelpers, updateProgress } from "../progress";
 import type { ScoredJob } from "./types";
 
-type ProcessJobFn = (
+type JobStageResult = { success: boolean; error?: string };
+type JobStageFn = (
   jobId: string,
   options?: { force?: boolean },
-) => Promise<{ success: boolean; error?: string }>;
-const PROCESSING_CONCURRENCY = 3;
+) => Promise<JobStageResult>;
+
+// Summaries (LLM) and PDFs (resume renderer) are capped separately so a job's
+// PDF renders while the next jobs are still being summarized.
+const SUMMARY_CONCURRENCY = 3;
+const PDF_CONCURRENCY = 3;
+
+async function runStage(
+  stage: JobStageFn,
+  jobId: string,
+): Promise<JobStageResult> {
+  try {
+    return await stage(jobId, { force: false });
+  } catch (error) {
+    const message = error instanceof Error ? error.message : "Unknown error";
+    return { success: false, error: message };
+  }
+}
 
 export async function processJobsStep(args: {
   jobsToProcess: ScoredJob[];
-  processJob: ProcessJobFn;
+  summarizeJob: JobStageFn;
+  generateFinalPdf: JobStageFn;
   shouldCancel?: () => boolean;
 }): Promise<{ processedCount: number }> {
   let processedCount = 0;
@@ -20,6 +38,21 @@ export async function processJobsStep(args: {
     const total = args.jobsToProcess.length;
     let startedCount = 0;
     let completedCount = 0;
+    const limitPdf = createConcurrencyLimiter(PDF_CONCURRENCY);
+    const pdfTasks: Promise<void>[] = [];
+
+    const finishJob = (job: ScoredJob, result: JobStageResult) => {
+      completedCount += 1;
+      progressHelpers.jobComplete(completedCount, total);
+      if (result.success) {
+        processedCount += 1;
+      } else {
+        logger.warn("Failed to process job", {
+          jobId: job.id,
+          error: result.error,
+        });
+      }
+    };
 
     updateProgress({
       step: "processing",
@@ -29,29 +62,31 @@ export async function processJobsStep(args: {
 
     await asyncPool({
       items: args.jobsToProcess,
-      concurrency: PROCESSING_CONCURRENCY,
+      concurrency: SUMMARY_CONCURRENCY,
       shouldStop: args.shouldCancel,
       onTaskStarted: (job) => {
         startedCount += 1;
         progressHelpers.processingJob(startedCount, total, job);
       },
-      onTaskSettled: (_job, _index) => {
-        completedCount += 1;
-        progressHelpers.jobComplete(completedCount, total);
-      },
       task: async (job) => {
-        const result = await args.processJob(job.id, { force: false });
-        if (result.success) {
-          processedCount += 1;
-        } else {
-          logger.warn("Failed to process job", {
-            jobId: job.id,
-            error: result.error,
-          });
+        const summaryResult = await runStage(args.summarizeJob, job.id);
+        if (!summaryResult.success) {
+          finishJob(job, summaryResult);
+          return;
         }
-        return result;
+
+        // Queue the render without holding the summary slot.
+        pdfTasks.push(
+          limitPdf(async () => {
+            // Renders still queued when the run is cancelled are skipped.
+            if (args.shouldCancel?.()) return;
+            finishJob(job, await runStage(args.generateFinalPdf, job.id));
+          }),
+        );
       },
     });
+
+    await Promise.all(pdfTasks);
   }
 
   return { processedCount };
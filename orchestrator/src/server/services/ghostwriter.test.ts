@@ -271,6 +271,79 @@ describe("ghostwriter service", () => {
     ).toEqual([{ role: "assistant", content: "Draft response" }]);
   });
 
+  it("forwards the response text as the LLM streams it", async () => {
+    mocks.repo.createMessage
+      .mockResolvedValueOnce(baseUserMessage)
+      .mockResolvedValueOnce({ ...baseAssistantMessage, status: "partial" });
+    const chunks = ['{"resp', 'onse": " Hi \\"th', 'ere\\"\\n", "x"}'];
+    mocks.llmCallJson.mockImplementation(async (request) => {
+      for (const chunk of chunks) request.onTextDelta?.(chunk);
+      return { success: true, data: { response: ' Hi "there"\n' } };
+    });
+
+    const onDelta = vi.fn();
+    await sendMessageForJob({
+      jobId: "job-1",
+      content: "Say hi",
+      stream: {
+        onReady: vi.fn(),
+        onDelta,
+        onCompleted: vi.fn(),
+        onCancelled: vi.fn(),
+        onError: vi.fn(),
+      },
+    });
+
+    expect(onDelta.mock.calls.map(([payload]) => payload.delta)).toEqual([
+      'Hi "th',
+      'ere"\n',
+    ]);
+    expect(mocks.repo.updateMessage).toHaveBeenLastCalledWith(
+      baseAssistantMessage.id,
+      expect.objectContaining({ content: 'Hi "there"', status: "complete" }),
+    );
+  });
+
+  it("resets the streamed text when a stalled attempt is retried", async () => {
+    mocks.repo.createMessage
+      .mockResolvedValueOnce(baseUserMessage)
+      .mockResolvedValueOnce({ ...baseAssistantMessage, status: "partial" });
+    mocks.llmCallJson.mockImplementation(async (request) => {
+      const attempts = [
+        ['{"response": "Hel', "lo wor"],
+        ['{"response": "', 'Hello world"}'],
+      ];
+      for (const chunks of attempts) {
+        request.onAttemptStart?.();
+        for (const chunk of chunks) request.onTextDelta?.(chunk);
+      }
+      return { success: true, data: { response: "Hello world" } };
+    });
+
+    const onDelta = vi.fn();
+    await sendMessageForJob({
+      jobId: "job-1",
+      content: "Say hello",
+      stream: {
+        onReady: vi.fn(),
+        onDelta,
+        onCompleted: vi.fn(),
+        onCancelled: vi.fn(),
+        onError: vi.fn(),
+      },
+    });
+
+    expect(onDelta.mock.calls.map(([payload]) => payload.delta)).toEqual([
+      "Hel",
+      "lo wor",
+      "ld",
+    ]);
+    expect(mocks.repo.updateMessage).toHaveBeenLastCalledWith(
+      baseAssistantMessage.id,
+      expect.objectContaining({ content: "Hello world", status: "complete" }),
+    );
+  });
+
   it("rejects empty message content", async () => {
     await expect(
       sendMessage({
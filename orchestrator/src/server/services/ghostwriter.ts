@@ -53,6 +53,69 @@ function chunkText(value: string, maxChunk = 60): string[] {
   return chunks;
 }
 
+const RESPONSE_FIELD_START = /"response"\s*:\s*"/;
+const JSON_STRING_ESCAPES: Record<string, string> = {
+  b: "\b",
+  f: "\f",
+  n: "\n",
+  r: "\r",
+  t: "\t",
+};
+
+/**
+ * Incrementally decodes the `response` string of a streamed
+ * `{"response": "..."}` payload, returning the newly decoded text per chunk.
+ */
+function createResponseTextDecoder(): (chunk: string) => string {
+  let buffer = "";
+  let inValue = false;
+  let done = false;
+
+  return (chunk) => {
+    if (done) return "";
+    buffer += chunk;
+
+    if (!inValue) {
+      const match = RESPONSE_FIELD_START.exec(buffer);
+      if (!match) return "";
+      inValue = true;
+      buffer = buffer.slice(match.index + match[0].length);
+    }
+
+    let decoded = "";
+    let cursor = 0;
+    while (cursor < buffer.length) {
+      const char = buffer[cursor];
+      if (char === '"') {
+        done = true;
+        buffer = "";
+        return decoded;
+      }
+      if (char !== "\\") {
+        decoded += char;
+        cursor += 1;
+        continue;
+      }
+
+      // Wait for the rest of a split escape sequence.
+      const escaped = buffer[cursor + 1];
+      if (escaped === undefined) break;
+      if (escaped === "u") {
+        const hex = buffer.slice(cursor + 2, cursor + 6);
+        if (hex.length < 4) break;
+        decoded += String.fromCharCode(Number.parseInt(hex, 16));
+        cursor += 6;
+        continue;
+      }
+      decoded += JSON_STRING_ESCAPES[escaped] ?? escaped;
+      cursor += 2;
+    }
+
+    buffer = buffer.slice(cursor);
+    return decoded;
+  };
+}
+
 function isRunningRunUniqueConstraintError(error: unknown): boolean {
   const message = error instanceof Error ? error.message : String(error);
   return (
@@ -260,7 +323,10 @@ async function runAssistantReply(
     requestId,
   });
 
+  // Text already forwarded to the client, and the current attempt's text.
   let accumulated = "";
+  let attemptText = "";
+  let decodeResponseText = createResponseTextDecoder();
 
   try {
     const llm = new LlmService({
@@ -295,6 +361,30 @@ async function runAssistantReply(
       retryDelayMs: 300,
       jobId: options.jobId,
       signal: controller.signal,
+      onAttemptStart: () => {
+        decodeResponseText = createResponseTextDecoder();
+        attemptText = "";
+      },
+      onTextDelta: (chunk) => {
+        attemptText += decodeResponseText(chunk);
+        const text = attemptText.trimStart();
+        // A retry re-streams text the client already has; forward only what
+        // extends it.
+        if (
+          controller.signal.aborted ||
+          text.length <= accumulated.length ||
+          !text.startsWith(accumulated)
+        ) {
+          return;
+        }
+        const delta = text.slice(accumulated.length);
+        accumulated = text;
+        options.stream?.onDelta({
+          runId: run.id,
+          messageId: assistantMessage.id,
+          delta,
+        });
+      },
     });
 
     if (!llmResult.success) {
@@ -307,7 +397,15 @@ async function runAssistantReply(
     }
 
     const finalText = (llmResult.data.response || "").trim();
-    const chunks = chunkText(finalText);
+    // Providers without streaming support deliver the reply in one piece;
+    // replay whatever was not already streamed in small chunks. If a retry
+    // diverged from the streamed text, the completed message replaces it.
+    const streamed = accumulated.trimEnd();
+    const extendsStream = finalText.startsWith(streamed);
+    accumulated = extendsStream ? streamed : finalText;
+    const chunks = extendsStream
+      ? chunkText(finalText.slice(streamed.length))
+      : [];
 
     for (const chunk of chunks) {
       if (controller.signal.aborted) {
@@ -172,6 +172,65 @@ describe("LlmService", () => {
     expect(headers["X-Title"]).toBe("JobOpsOrchestrator");
   });
 
+  it("streams text deltas when onTextDelta is provided", async () => {
+    process.env.LLM_PROVIDER = "lmstudio";
+    const events = ['{"value": "st', 'reamed", "count": 2}'].map(
+      (content) =>
+        `data: ${JSON.stringify({ choices: [{ delta: { content } }] })}\n\n`,
+    );
+    vi.mocked(global.fetch).mockResolvedValue(
+      new Response(`: keep-alive\n\n${events.join("")}data: [DONE]\n\n`),
+    );
+
+    const deltas: string[] = [];
+    const llm = new LlmService();
+    const result = await llm.callJson<{ value: string; count: number }>({
+      model: "test-model",
+      messages: [{ role: "user", content: "test" }],
+      jsonSchema: testSchema,
+      onTextDelta: (delta) => deltas.push(delta),
+    });
+
+    const body = JSON.parse(
+      vi.mocked(global.fetch).mock.calls[0][1]?.body as string,
+    );
+    expect(body.stream).toBe(true);
+    expect(deltas).toEqual(['{"value": "st', 'reamed", "count": 2}']);
+    expect(result).toEqual({
+      success: true,
+      data: { value: "streamed", count: 2 },
+    });
+  });
+
+  it("keeps OpenRouter responses unstreamed so response healing applies", async () => {
+    vi.mocked(global.fetch).mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        choices: [{ message: { content: '{"value": "healed", "count": 1}' } }],
+      }),
+    } as Response);
+
+    const deltas: string[] = [];
+    const llm = new LlmService();
+    const result = await llm.callJson<{ value: string; count: number }>({
+      model: "test-model",
+      messages: [{ role: "user", content: "test" }],
+      jsonSchema: testSchema,
+      onTextDelta: (delta) => deltas.push(delta),
+    });
+
+    const body = JSON.parse(
+      vi.mocked(global.fetch).mock.calls[0][1]?.body as string,
+    );
+    expect(body.stream).toBe(false);
+    expect(body.plugins).toEqual([{ id: "response-healing" }]);
+    expect(deltas).toEqual([]);
+    expect(result).toEqual({
+      success: true,
+      data: { value: "healed", count: 1 },
+    });
+  });
+
   it("retries on parsing failures when maxRetries is set", async () => {
     let callCount = 0;
     vi.mocked(global.fetch).mockImplementation(async () => {
@@ -214,6 +273,135 @@ describe("LlmService", () => {
     expect(callCount).toBe(3);
   });
 
+  it("waits for the provider's Retry-After before retrying a 429", async () => {
+    vi.useFakeTimers();
+    vi.mocked(global.fetch)
+      .mockResolvedValueOnce({
+        ok: false,
+        status: 429,
+        headers: new Headers({ "retry-after": "2" }),
+        text: async () => JSON.stringify({ error: "rate limited" }),
+      } as Response)
+      .mockResolvedValueOnce({
+        ok: true,
+        json: async () => ({
+          choices: [{ message: { content: '{"value": "ok", "count": 1}' } }],
+        }),
+      } as Response);
+
+    vi.spyOn(console, "log").mockImplementation(() => {});
+    vi.spyOn(console, "warn").mockImplementation(() => {});
+
+    try {
+      const llm = new LlmService();
+      const pending = llm.callJson<{ value: string; count: number }>({
+        model: "test-model",
+        messages: [{ role: "user", content: "test" }],
+        jsonSchema: testSchema,
+        maxRetries: 1,
+        retryDelayMs: 10,
+      });
+
+      await vi.advanceTimersByTimeAsync(1_000);
+      expect(global.fetch).toHaveBeenCalledTimes(1);
+
+      await vi.advanceTimersByTimeAsync(1_000);
+      const result = await pending;
+
+      expect(global.fetch).toHaveBeenCalledTimes(2);
+      expect(result.success).toBe(true);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it("times out a stalled request and retries it", async () => {
+    vi.mocked(global.fetch)
+      .mockImplementationOnce(
+        (_input, init) =>
+          new Promise<Response>((_resolve, reject) => {
+            init?.signal?.addEventListener("abort", () =>
+              reject(init.signal?.reason),
+            );
+          }),
+      )
+      .mockResolvedValueOnce({
+        ok: true,
+        json: async () => ({
+          choices: [{ message: { content: '{"value": "ok", "count": 1}' } }],
+        }),
+      } as Response);
+
+    vi.spyOn(console, "log").mockImplementation(() => {});
+    vi.spyOn(console, "warn").mockImplementation(() => {});
+
+    const onAttemptStart = vi.fn();
+    const llm = new LlmService();
+    const result = await llm.callJson<{ value: string; count: number }>({
+      model: "test-model",
+      messages: [{ role: "user", content: "test" }],
+      jsonSchema: testSchema,
+      maxRetries: 1,
+      retryDelayMs: 1,
+      timeoutMs: 20,
+      onAttemptStart,
+    });
+
+    expect(result.success).toBe(true);
+    expect(global.fetch).toHaveBeenCalledTimes(2);
+    expect(onAttemptStart).toHaveBeenCalledTimes(2);
+  });
+
+  it("reports a timeout when retries are exhausted", async () => {
+    vi.mocked(global.fetch).mockImplementation(
+      (_input, init) =>
+        new Promise<Response>((_resolve, reject) => {
+          init?.signal?.addEventListener("abort", () =>
+            reject(init.signal?.reason),
+          );
+        }),
+    );
+
+    const llm = new LlmService();
+    const result = await llm.callJson({
+      model: "test-model",
+      messages: [{ role: "user", content: "test" }],
+      jsonSchema: testSchema,
+      timeoutMs: 20,
+    });
+
+    expect(result).toEqual({
+      success: false,
+      error: "LLM request timeout after 20ms",
+    });
+  });
+
+  it("applies no default timeout to local providers", async () => {
+    delete process.env.LLM_REQUEST_TIMEOUT_MS;
+    vi.mocked(global.fetch).mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        choices: [{ message: { content: '{"value": "ok", "count": 1}' } }],
+      }),
+    } as Response);
+    const call = () =>
+      new LlmService().callJson({
+        model: "test-model",
+        messages: [{ role: "user", content: "test" }],
+        jsonSchema: testSchema,
+      });
+
+    await call();
+    process.env.LLM_PROVIDER = "ollama";
+    await call();
+
+    const signals = vi
+      .mocked(global.fetch)
+      .mock.calls.map(([, init]) => init?.signal);
+    expect(signals[0]).toBeInstanceOf(AbortSignal);
+    expect(signals[1]).toBeUndefined();
+  });
+
   it("falls back to a looser mode when schema is rejected", async () => {
     process.env.LLM_PROVIDER = "lmstudio";
     delete process.env.OPENROUTER_API_KEY;
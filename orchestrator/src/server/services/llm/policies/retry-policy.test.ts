@@ -1,5 +1,9 @@
 import { describe, expect, it } from "vitest";
-import { getRetryDelayMs, shouldRetryAttempt } from "./retry-policy";
+import {
+  getRetryAfterMs,
+  getRetryDelayMs,
+  shouldRetryAttempt,
+} from "./retry-policy";
 
 describe("retry-policy", () => {
   it("retries parse errors", () => {
@@ -39,4 +43,49 @@ describe("retry-policy", () => {
     expect(getRetryDelayMs(500, 1)).toBe(500);
     expect(getRetryDelayMs(500, 2)).toBe(1000);
   });
+
+  it("doubles the backoff for each further attempt", () => {
+    expect(getRetryDelayMs(500, 3)).toBe(2000);
+    expect(getRetryDelayMs(500, 4)).toBe(4000);
+  });
+
+  it("reads provider retry hints from response headers", () => {
+    const now = Date.parse("2026-01-01T00:00:00Z");
+
+    expect(getRetryAfterMs(new Headers({ "retry-after": "3" }), now)).toBe(
+      3000,
+    );
+    expect(
+      getRetryAfterMs(
+        new Headers({ "retry-after": "Thu, 01 Jan 2026 00:00:05 GMT" }),
+        now,
+      ),
+    ).toBe(5000);
+    expect(
+      getRetryAfterMs(
+        new Headers({
+          "x-ratelimit-remaining": "0",
+          "x-ratelimit-reset": String(now + 1500),
+        }),
+        now,
+      ),
+    ).toBe(1500);
+    expect(
+      getRetryAfterMs(
+        new Headers({
+          "x-ratelimit-remaining": "12",
+          "x-ratelimit-reset": String(now + 1500),
+        }),
+        now,
+      ),
+    ).toBeNull();
+    expect(getRetryAfterMs(new Headers(), now)).toBeNull();
+    expect(getRetryAfterMs(undefined, now)).toBeNull();
+  });
+
+  it("caps provider retry hints", () => {
+    expect(getRetryAfterMs(new Headers({ "retry-after": "3600" }))).toBe(
+      60_000,
+    );
+  });
 });
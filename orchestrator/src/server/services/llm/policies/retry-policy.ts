@@ -1,3 +1,5 @@
+const MAX_RETRY_AFTER_MS = 60_000;
+
 export function shouldRetryAttempt(args: {
   message: string;
   status?: number;
@@ -12,5 +14,50 @@ export function shouldRetryAttempt(args: {
 }
 
 export function getRetryDelayMs(baseDelayMs: number, attempt: number): number {
-  return baseDelayMs * attempt;
+  return baseDelayMs * 2 ** Math.max(0, attempt - 1);
+}
+
+type HeaderReader = Pick<Headers, "get">;
+
+/**
+ * Delay requested by the provider before the next call, from `Retry-After`
+ * (seconds or HTTP date), `retry-after-ms`, or an exhausted
+ * `x-ratelimit-remaining` paired with an `x-ratelimit-reset` timestamp.
+ * Capped so a misbehaving header cannot stall a pipeline run.
+ */
+export function getRetryAfterMs(
+  headers: HeaderReader | null | undefined,
+  now = Date.now(),
+): number | null {
+  if (!headers) return null;
+
+  const delayMs = readRetryAfterMs(headers, now);
+  if (delayMs === null || !Number.isFinite(delayMs)) return null;
+  return Math.min(Math.max(delayMs, 0), MAX_RETRY_AFTER_MS);
+}
+
+function readRetryAfterMs(headers: HeaderReader, now: number): number | null {
+  const retryAfterMs = headers.get("retry-after-ms")?.trim();
+  if (retryAfterMs && Number.isFinite(Number(retryAfterMs))) {
+    return Number(retryAfterMs);
+  }
+
+  const retryAfter = headers.get("retry-after")?.trim();
+  if (retryAfter) {
+    const seconds = Number(retryAfter);
+    if (Number.isFinite(seconds)) return seconds * 1000;
+    const date = Date.parse(retryAfter);
+    if (Number.isFinite(date)) return date - now;
+  }
+
+  const remaining = headers.get("x-ratelimit-remaining")?.trim();
+  const reset = Number(headers.get("x-ratelimit-reset")?.trim() || undefined);
+  if (remaining === "0" && Number.isFinite(reset)) {
+    // OpenRouter reports the reset as an epoch timestamp in milliseconds;
+    // some providers use epoch seconds instead.
+    const resetAtMs = reset > 1e12 ? reset : reset * 1000;
+    return resetAtMs - now;
+  }
+
+  return null;
 }
@@ -34,12 +34,13 @@ export function buildChatCompletionsBody(args: {
   model: string;
   messages: LlmRequestOptions<unknown>["messages"];
   jsonSchema: JsonSchemaDefinition;
+  stream?: boolean;
   extra?: Record<string, unknown>;
 }): Record<string, unknown> {
   const body: Record<string, unknown> = {
     model: args.model,
     messages: args.messages,
-    stream: false,
+    stream: args.stream ?? false,
     ...(args.extra ?? {}),
   };
 
@@ -70,3 +71,8 @@ export function extractChatCompletionsText(response: unknown): string | null {
   ]);
   return typeof content === "string" ? content : null;
 }
+
+export function extractChatCompletionsDelta(event: unknown): string | null {
+  const content = getNestedValue(event, ["choices", 0, "delta", "content"]);
+  return typeof content === "string" ? content : null;
+}
@@ -2,6 +2,7 @@ import { buildHeaders, joinUrl } from "../utils/http";
 import {
   buildChatCompletionsBody,
   createProviderStrategy,
+  extractChatCompletionsDelta,
   extractChatCompletionsText,
 } from "./factory";
 
@@ -11,12 +12,19 @@ export const ollamaStrategy = createProviderStrategy({
   requiresApiKey: false,
   modes: ["json_schema", "text", "none"],
   validationPaths: ["/v1/models", "/api/tags"],
-  buildRequest: ({ mode, baseUrl, model, messages, jsonSchema }) => {
+  buildRequest: ({ mode, baseUrl, model, messages, jsonSchema, stream }) => {
     return {
       url: joinUrl(baseUrl, "/v1/chat/completions"),
       headers: buildHeaders({ apiKey: null, provider: "ollama" }),
-      body: buildChatCompletionsBody({ mode, model, messages, jsonSchema }),
+      body: buildChatCompletionsBody({
+        mode,
+        model,
+        messages,
+        jsonSchema,
+        stream,
+      }),
     };
   },
   extractText: extractChatCompletionsText,
+  extractStreamDelta: extractChatCompletionsDelta,
 });
@@ -2,6 +2,7 @@ import { buildHeaders, joinUrl } from "../utils/http";
 import {
   buildChatCompletionsBody,
   createProviderStrategy,
+  extractChatCompletionsDelta,
   extractChatCompletionsText,
 } from "./factory";
 
@@ -49,12 +50,27 @@ export const openAiCompatibleStrategy = createProviderStrategy({
   modes: ["json_schema", "json_object", "text", "none"],
   validationPaths: ["/v1/models"],
   getValidationUrls: ({ baseUrl }) => [resolveModelsUrl(baseUrl)],
-  buildRequest: ({ mode, baseUrl, apiKey, model, messages, jsonSchema }) => {
+  buildRequest: ({
+    mode,
+    baseUrl,
+    apiKey,
+    model,
+    messages,
+    jsonSchema,
+    stream,
+  }) => {
     return {
       url: resolveChatCompletionsUrl(baseUrl),
       headers: buildHeaders({ apiKey, provider: "openai_compatible" }),
-      body: buildChatCompletionsBody({ mode, model, messages, jsonSchema }),
+      body: buildChatCompletionsBody({
+        mode,
+        model,
+        messages,
+        jsonSchema,
+        stream,
+      }),
     };
   },
   extractText: extractChatCompletionsText,
+  extractStreamDelta: extractChatCompletionsDelta,
 });
@@ -5,6 +5,9 @@ import {
   extractChatCompletionsText,
 } from "./factory";
 
+// No extractStreamDelta: OpenRouter's response-healing plugin only repairs
+// non-streamed responses, and malformed JSON costs a full retry. Ghostwriter
+// replies on OpenRouter arrive in one piece instead.
 export const openRouterStrategy = createProviderStrategy({
   provider: "openrouter",
   defaultBaseUrl: "https://openrouter.ai",
@@ -121,6 +121,7 @@ describe("provider adapters", () => {
         ...testCase.args,
         messages,
         jsonSchema: schema,
+        stream: false,
       });
 
       if (testCase.expectedUrl) {
@@ -151,6 +152,27 @@ describe("provider adapters", () => {
     expect(ollamaStrategy.extractText(response)).toBe("ok");
   });
 
+  it("streams chat-completions deltas only when requested", () => {
+    const request = openAiCompatibleStrategy.buildRequest({
+      mode: "json_schema",
+      baseUrl: "https://api.example.com",
+      apiKey: "x",
+      model: "model-a",
+      messages,
+      jsonSchema: schema,
+      stream: true,
+    });
+    expect((request.body as Record<string, unknown>).stream).toBe(true);
+
+    const event = { choices: [{ delta: { content: "o" } }] };
+    expect(openAiCompatibleStrategy.extractStreamDelta?.(event)).toBe("o");
+    expect(lmStudioStrategy.extractStreamDelta?.(event)).toBe("o");
+    // Streaming would bypass OpenRouter's response-healing plugin.
+    expect(openRouterStrategy.extractStreamDelta).toBeUndefined();
+    expect(openAiStrategy.extractStreamDelta).toBeUndefined();
+    expect(geminiStrategy.extractStreamDelta).toBeUndefined();
+  });
+
   it("builds validation URLs for OpenAI-compatible base URLs and endpoints", () => {
     expect(
       openAiCompatibleStrategy.getValidationUrls({
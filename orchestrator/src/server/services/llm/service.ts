@@ -1,11 +1,16 @@
 import { logger } from "@infra/logger";
+import { discardResponseBody } from "@server/utils/fetch";
 import { toStringOrNull } from "@shared/utils/type-conversion";
 import {
   buildModeCacheKey,
   getOrderedModes,
   rememberSuccessfulMode,
 } from "./policies/mode-selection";
-import { getRetryDelayMs, shouldRetryAttempt } from "./policies/retry-policy";
+import {
+  getRetryAfterMs,
+  getRetryDelayMs,
+  shouldRetryAttempt,
+} from "./policies/retry-policy";
 import { strategies } from "./providers";
 import type {
   JsonSchemaDefinition,
@@ -24,6 +29,7 @@ import {
   joinUrl,
 } from "./utils/http";
 import { parseJsonContent } from "./utils/json";
+import { readStreamedText } from "./utils/stream";
 import { parseErrorMessage, truncate } from "./utils/string";
 
 export class LlmService {
@@ -84,7 +90,10 @@ export class LlmService {
       jsonSchema,
       maxRetries = 0,
       retryDelayMs = 500,
+      timeoutMs = resolveRequestTimeoutMs(this.provider),
       signal,
+      onTextDelta,
+      onAttemptStart,
     } = options;
     const jobId = options.jobId;
 
@@ -99,8 +108,11 @@ export class LlmService {
         jsonSchema,
         maxRetries,
         retryDelayMs,
+        timeoutMs,
         jobId,
         signal,
+        onTextDelta,
+        onAttemptStart,
       });
 
       if (result.success) {
@@ -150,6 +162,7 @@ export class LlmService {
         });
 
         if (response.ok) {
+          await discardResponseBody(response);
           return { valid: true, message: null };
         }
 
@@ -216,8 +229,11 @@ export class LlmService {
     jsonSchema: JsonSchemaDefinition;
     maxRetries: number;
     retryDelayMs: number;
+    timeoutMs: number;
     jobId?: string;
     signal?: AbortSignal;
+    onTextDelta?: (delta: string) => void;
+    onAttemptStart?: () => void;
   }): Promise<LlmResponse<T>> {
     const {
       mode,
@@ -226,22 +242,36 @@ export class LlmService {
       jsonSchema,
       maxRetries,
       retryDelayMs,
+      timeoutMs,
       signal,
+      onTextDelta,
+      onAttemptStart,
     } = args;
     const jobId = args.jobId;
     const model = normalizeModelForProvider(this.provider, rawModel);
+    const extractStreamDelta = onTextDelta
+      ? this.strategy.extractStreamDelta
+      : undefined;
+
+    let retryAfterMs = 0;
 
     for (let attempt = 0; attempt <= maxRetries; attempt++) {
       try {
         if (attempt > 0) {
+          const delayMs = Math.max(
+            getRetryDelayMs(retryDelayMs, attempt),
+            retryAfterMs,
+          );
           logger.info("LLM retry attempt", {
             jobId: jobId ?? "unknown",
             attempt,
             maxRetries,
+            delayMs,
           });
-          await sleep(getRetryDelayMs(retryDelayMs, attempt));
+          await sleep(delayMs);
         }
 
+        onAttemptStart?.();
         const { url, headers, body } = this.strategy.buildRequest({
           mode,
           baseUrl: this.baseUrl,
@@ -249,13 +279,14 @@ export class LlmService {
           model,
           messages,
           jsonSchema,
+          stream: Boolean(extractStreamDelta),
         });
 
         const response = await fetch(url, {
           method: "POST",
           headers,
           body: JSON.stringify(body),
-          signal,
+          signal: withRequestTimeout(signal, timeoutMs),
         });
 
         if (!response.ok) {
@@ -267,11 +298,14 @@ export class LlmService {
           ) as LlmApiError;
           err.status = response.status;
           err.body = truncate(errorBody, 600);
+          err.retryAfterMs = getRetryAfterMs(response.headers) ?? undefined;
           throw err;
         }
 
-        const data = await response.json();
-        const content = this.strategy.extractText(data);
+        const content =
+          extractStreamDelta && onTextDelta
+            ? await readStreamedText(response, extractStreamDelta, onTextDelta)
+            : this.strategy.extractText(await response.json());
 
         if (!content) {
           throw new Error("No content in response");
@@ -280,7 +314,12 @@ export class LlmService {
         const parsed = parseJsonContent<T>(content, jobId);
         return { success: true, data: parsed };
       } catch (error) {
-        const message = error instanceof Error ? error.message : String(error);
+        const message =
+          error instanceof Error && error.name === "TimeoutError"
+            ? `LLM request timeout after ${timeoutMs}ms`
+            : error instanceof Error
+              ? error.message
+              : String(error);
         const status = (error as LlmApiError).status;
         const body = (error as LlmApiError).body;
 
@@ -294,12 +333,18 @@ export class LlmService {
           return { success: false, error: `CAPABILITY:${message}` };
         }
 
-        if (attempt < maxRetries && shouldRetryAttempt({ message, status })) {
+        if (
+          attempt < maxRetries &&
+          !signal?.aborted &&
+          shouldRetryAttempt({ message, status })
+        ) {
+          retryAfterMs = (error as LlmApiError).retryAfterMs ?? 0;
           logger.warn("LLM attempt failed, retrying", {
             jobId: jobId ?? "unknown",
             attempt: attempt + 1,
             maxRetries,
             status: status ?? "no-status",
+            retryAfterMs: retryAfterMs || null,
             message,
           });
           continue;
@@ -421,6 +466,26 @@ function normalizeProvider(
   return "openrouter";
 }
 
+const DEFAULT_REQUEST_TIMEOUT_MS = 120_000;
+
+function resolveRequestTimeoutMs(provider: LlmProvider): number {
+  const parsed = Number.parseInt(process.env.LLM_REQUEST_TIMEOUT_MS ?? "", 10);
+  if (Number.isFinite(parsed) && parsed >= 0) return parsed;
+  // Local models on CPU can legitimately take minutes per call, so they are
+  // only capped when LLM_REQUEST_TIMEOUT_MS is set.
+  if (provider === "lmstudio" || provider === "ollama") return 0;
+  return DEFAULT_REQUEST_TIMEOUT_MS;
+}
+
+function withRequestTimeout(
+  signal: AbortSignal | undefined,
+  timeoutMs: number,
+): AbortSignal | undefined {
+  if (timeoutMs <= 0) return signal;
+  const timeout = AbortSignal.timeout(timeoutMs);
+  return signal ? AbortSignal.any([signal, timeout]) : timeout;
+}
+
 function sleep(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
@@ -27,12 +27,25 @@ export interface LlmRequestOptions<_T> {
   jsonSchema: JsonSchemaDefinition;
   /** Number of retries on parsing failures (default: 0) */
   maxRetries?: number;
-  /** Delay between retries in ms (default: 500) */
+  /** Base delay between retries in ms, doubled per attempt (default: 500) */
   retryDelayMs?: number;
+  /**
+   * Per-attempt request timeout in ms (default: LLM_REQUEST_TIMEOUT_MS, else
+   * 120000, or no timeout for LM Studio/Ollama; 0 disables)
+   */
+  timeoutMs?: number;
   /** Job ID for logging purposes */
   jobId?: string;
   /** Optional abort signal for cancellation */
   signal?: AbortSignal;
+  /**
+   * Receives raw response text as it is generated. Only providers with a
+   * streaming decoder stream; others return the full response as before.
+   * Deltas from a failed attempt are not retracted on retry.
+   */
+  onTextDelta?: (delta: string) => void;
+  /** Called before each request attempt, so streamed state can be reset. */
+  onAttemptStart?: () => void;
 }
 
 export interface LlmResult<T> {
@@ -71,8 +84,11 @@ export type ProviderStrategy = {
     model: string;
     messages: LlmRequestOptions<unknown>["messages"];
     jsonSchema: JsonSchemaDefinition;
+    stream: boolean;
   }) => { url: string; headers: Record<string, string>; body: unknown };
   extractText: (response: unknown) => string | null;
+  /** Extracts the text delta from one streamed event, when supported. */
+  extractStreamDelta?: (event: unknown) => string | null;
   isCapabilityError: (args: {
     mode: ResponseMode;
     status?: number;
@@ -87,4 +103,5 @@ export type ProviderStrategy = {
 export interface LlmApiError extends Error {
   status?: number;
   body?: string;
+  retryAfterMs?: number;
 }
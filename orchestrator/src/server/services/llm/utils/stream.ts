@@ -0,0 +1,51 @@
+/**
+ * Reads a server-sent events response body, forwarding each text delta as it
+ * arrives and returning the concatenated text once the stream ends.
+ */
+export async function readStreamedText(
+  response: Response,
+  extractDelta: (event: unknown) => string | null,
+  onDelta: (delta: string) => void,
+): Promise<string> {
+  if (!response.body) return "";
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  const parts: string[] = [];
+  let buffer = "";
+
+  const handleLine = (line: string) => {
+    if (!line.startsWith("data:")) return;
+    const payload = line.slice(5).trim();
+    if (!payload || payload === "[DONE]") return;
+
+    let event: unknown;
+    try {
+      event = JSON.parse(payload);
+    } catch {
+      return;
+    }
+
+    const delta = extractDelta(event);
+    if (!delta) return;
+    parts.push(delta);
+    onDelta(delta);
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value, { stream: !done });
+
+    let newline = buffer.indexOf("\n");
+    while (newline !== -1) {
+      handleLine(buffer.slice(0, newline).trimEnd());
+      buffer = buffer.slice(newline + 1);
+      newline = buffer.indexOf("\n");
+    }
+
+    if (done) break;
+  }
+
+  handleLine(buffer.trimEnd());
+  return parts.join("");
+}
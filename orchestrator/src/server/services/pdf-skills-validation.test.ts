@@ -163,11 +163,14 @@ vi.mock("./rxresume", async () => {
   const { createId } = await import("@paralleldrive/cuid2");
   const profileModule = await import("./profile");
   return {
-    importResume: vi.fn().mockResolvedValue("temp-resume-id"),
-    exportResumePdf: vi
-      .fn()
-      .mockResolvedValue("https://pdf.rxresume.test/print/123"),
-    deleteResume: vi.fn().mockResolvedValue(undefined),
+    openRxResumeSession: vi.fn().mockResolvedValue({
+      mode: "v4",
+      importResume: vi.fn().mockResolvedValue("temp-resume-id"),
+      exportResumePdf: vi
+        .fn()
+        .mockResolvedValue("https://pdf.rxresume.test/print/123"),
+      deleteResume: vi.fn().mockResolvedValue(undefined),
+    }),
     getResume: vi.fn().mockImplementation(async () => ({
       id: "base-resume-id",
       name: "Base Resume",
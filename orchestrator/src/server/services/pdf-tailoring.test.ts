@@ -160,11 +160,14 @@ vi.mock("./rxresume", async () => {
   const clone = <T>(value: T): T => JSON.parse(JSON.stringify(value));
   const projectSelectionModule = await import("./projectSelection");
   return {
-    importResume: vi.fn().mockResolvedValue("temp-resume-id"),
-    exportResumePdf: vi
-      .fn()
-      .mockResolvedValue("https://pdf.rxresume.test/print/123"),
-    deleteResume: vi.fn().mockResolvedValue(undefined),
+    openRxResumeSession: vi.fn().mockResolvedValue({
+      mode: "v4",
+      importResume: vi.fn().mockResolvedValue("temp-resume-id"),
+      exportResumePdf: vi
+        .fn()
+        .mockResolvedValue("https://pdf.rxresume.test/print/123"),
+      deleteResume: vi.fn().mockResolvedValue(undefined),
+    }),
     getResume: vi.fn().mockResolvedValue({
       id: "base-resume-id",
       name: "Base Resume",
@@ -349,21 +352,29 @@ describe("PDF Service Tailoring Logic", () => {
     vi.stubGlobal("fetch", fetchMock);
 
     const rxresume = await import("./rxresume");
+    const session = {
+      mode: "v4" as const,
+      importResume: vi.fn().mockResolvedValue("temp-resume-id"),
+      exportResumePdf: vi
+        .fn()
+        .mockResolvedValue("https://pdf.rxresume.test/print/123"),
+      deleteResume: vi.fn().mockResolvedValue(undefined),
+    };
+    vi.mocked(rxresume.openRxResumeSession).mockResolvedValueOnce(session);
 
     try {
       await generatePdf("job-rxresume", {}, "desc");
 
       expect(mockResumeRenderer.renderResumePdf).not.toHaveBeenCalled();
-      expect(rxresume.importResume).toHaveBeenCalledWith(
-        {
-          name: "JobOps Tailored Resume job-rxresume",
-          data: expect.any(Object),
-        },
-        { mode: "v4" },
-      );
-      expect(rxresume.exportResumePdf).toHaveBeenCalledWith("temp-resume-id", {
+      expect(rxresume.openRxResumeSession).toHaveBeenCalledTimes(1);
+      expect(rxresume.openRxResumeSession).toHaveBeenCalledWith({
         mode: "v4",
       });
+      expect(session.importResume).toHaveBeenCalledWith({
+        name: "JobOps Tailored Resume job-rxresume",
+        data: expect.any(Object),
+      });
+      expect(session.exportResumePdf).toHaveBeenCalledWith("temp-resume-id");
       expect(fetchMock).toHaveBeenCalledWith(
         "https://pdf.rxresume.test/print/123",
       );
@@ -371,9 +382,7 @@ describe("PDF Service Tailoring Logic", () => {
         expect.stringContaining("resume_job-rxresume.pdf"),
         expect.any(Uint8Array),
       );
-      expect(rxresume.deleteResume).toHaveBeenCalledWith("temp-resume-id", {
-        mode: "v4",
-      });
+      expect(session.deleteResume).toHaveBeenCalledWith("temp-resume-id");
     } finally {
       vi.unstubAllGlobals();
     }
@@ -12,10 +12,8 @@ import type { PdfRenderer } from "@shared/types";
 import { getDataDir } from "../config/dataDir";
 import { renderResumePdf } from "./resume-renderer";
 import {
-  deleteResume as deleteRxResume,
-  exportResumePdf as exportRxResumePdf,
   getResume as getRxResume,
-  importResume as importRxResume,
+  openRxResumeSession,
   prepareTailoredResumeForPdf,
 } from "./rxresume";
 import { getConfiguredRxResumeBaseResumeId } from "./rxresume/baseResumeId";
@@ -69,25 +67,21 @@ async function renderRxResumePdf(args: {
   jobId: string;
 }): Promise<void> {
   const { preparedResume, outputPath, jobId } = args;
+  const session = await openRxResumeSession({ mode: preparedResume.mode });
   let importedResumeId: string | null = null;
 
   try {
-    importedResumeId = await importRxResume(
-      {
-        name: `JobOps Tailored Resume ${jobId}`,
-        data: preparedResume.data,
-      },
-      { mode: preparedResume.mode },
-    );
-
-    const downloadUrl = await exportRxResumePdf(importedResumeId, {
-      mode: preparedResume.mode,
+    importedResumeId = await session.importResume({
+      name: `JobOps Tailored Resume ${jobId}`,
+      data: preparedResume.data,
     });
+
+    const downloadUrl = await session.exportResumePdf(importedResumeId);
     await downloadRxResumePdf(downloadUrl, outputPath);
   } finally {
     if (importedResumeId) {
       try {
-        await deleteRxResume(importedResumeId, { mode: preparedResume.mode });
+        await session.deleteResume(importedResumeId);
       } catch (error) {
         logger.warn("Failed to clean up temporary Reactive Resume PDF export", {
           jobId,
@@ -118,16 +112,18 @@ export async function generatePdf(
   let renderer: PdfRenderer | null = null;
 
   try {
-    renderer = await resolvePdfRenderer();
+    // Renderer, base resume id and output directory are independent; resolve
+    // them together instead of paying for each round-trip in sequence.
+    const [resolvedRenderer, { resumeId: baseResumeId }] = await Promise.all([
+      resolvePdfRenderer(),
+      getConfiguredRxResumeBaseResumeId(),
+      existsSync(OUTPUT_DIR)
+        ? undefined
+        : mkdir(OUTPUT_DIR, { recursive: true }),
+    ]);
+    renderer = resolvedRenderer;
     logger.info("Generating PDF resume", { jobId, renderer });
 
-    // Ensure output directory exists
-    if (!existsSync(OUTPUT_DIR)) {
-      await mkdir(OUTPUT_DIR, { recursive: true });
-    }
-
-    const { resumeId: baseResumeId } =
-      await getConfiguredRxResumeBaseResumeId();
     if (!baseResumeId) {
       throw new Error(
         "Base resume not configured. Please select a base resume from your Reactive Resume account in Settings.",
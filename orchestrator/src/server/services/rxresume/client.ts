@@ -4,6 +4,7 @@
 // - Used by rxresume/v4.ts to provide a higher-level service surface.
 // - The v5 client should be a drop-in replacement in the future.
 
+import { discardResponseBody } from "@server/utils/fetch";
 import { normalizeWhitespace } from "@shared/utils/string";
 import type { ResumeData } from "./schema/v4";
 
@@ -383,6 +384,8 @@ class RxResumeClientImpl {
         `Delete failed: HTTP ${res.status} ${sanitizeResponseSnippet(text)}`,
       );
     }
+
+    await discardResponseBody(res);
   }
 
   private normalizeResume(raw: AnyObj): RxResumeResume {
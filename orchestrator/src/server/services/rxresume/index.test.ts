@@ -35,6 +35,7 @@ import {
   extractProjectsFromResume,
   getResume as getResumeFromAdapter,
   listResumes,
+  openRxResumeSession,
   prepareTailoredResumeForPdf,
   RxResumeAuthConfigError,
   resolveRxResumeMode,
@@ -110,6 +111,34 @@ describe("rxresume adapter", () => {
       { id: "r2", name: "Resume Two", title: "Resume Two" },
     ]);
   });
+  it("reuses resolved credentials across session operations", async () => {
+    mockSettings({ rxresumeMode: "v5", rxresumeApiKey: "v5-key" });
+    vi.mocked(v5.importResume).mockResolvedValue("imported-id");
+    vi.mocked(v5.exportResumePdf).mockResolvedValue(
+      "https://rxresu.me/pdf/imported-id",
+    );
+    vi.mocked(v5.deleteResume).mockResolvedValue(undefined);
+
+    const session = await openRxResumeSession();
+    const settingReadsAfterOpen = vi.mocked(getSetting).mock.calls.length;
+
+    const importedId = await session.importResume({
+      name: "Tailored",
+      data: { basics: {} },
+    });
+    const url = await session.exportResumePdf(importedId);
+    await session.deleteResume(importedId);
+
+    expect(session.mode).toBe("v5");
+    expect(url).toBe("https://rxresu.me/pdf/imported-id");
+    expect(vi.mocked(getSetting).mock.calls.length).toBe(settingReadsAfterOpen);
+    expect(v5.deleteResume).toHaveBeenCalledWith("imported-id", {
+      apiKey: "v5-key",
+      baseUrl: "https://rxresu.me",
+    });
+    expect(v4.importResume).not.toHaveBeenCalled();
+  });
+
   it("does not fall back to v4 at runtime when explicit v5 fails", async () => {
     mockSettings({
       rxresumeMode: "v5",
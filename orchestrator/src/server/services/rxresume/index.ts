@@ -343,14 +343,15 @@ export async function resolveRxResumeMode(
   return context.mode;
 }
 
-async function runRxResumeOperation<T>(
-  options: ResolveModeOptions,
-  handlers: {
-    v4: (creds: V4Credentials) => Promise<T>;
-    v5: (creds: V5Credentials) => Promise<T>;
-  },
+type RxResumeOperationHandlers<T> = {
+  v4: (creds: V4Credentials) => Promise<T>;
+  v5: (creds: V5Credentials) => Promise<T>;
+};
+
+async function runWithOperationContext<T>(
+  context: ResolvedOperationContext,
+  handlers: RxResumeOperationHandlers<T>,
 ): Promise<T> {
-  const context = await resolveOperationContext(options);
   try {
     if (context.mode === "v5") {
       return await handlers.v5(context.creds);
@@ -361,6 +362,14 @@ async function runRxResumeOperation<T>(
   }
 }
 
+async function runRxResumeOperation<T>(
+  options: ResolveModeOptions,
+  handlers: RxResumeOperationHandlers<T>,
+): Promise<T> {
+  const context = await resolveOperationContext(options);
+  return runWithOperationContext(context, handlers);
+}
+
 async function fetchResumeFromUpstream(
   resumeId: string,
   context: ResolvedOperationContext,
@@ -620,11 +629,10 @@ export async function prepareTailoredResumeForPdf(args: {
   };
 }
 
-export async function importResume(
+function importResumeHandlers(
   payload: RxResumeImportPayload,
-  options: ResolveModeOptions = {},
-): Promise<string> {
-  return runRxResumeOperation(options, {
+): RxResumeOperationHandlers<string> {
+  return {
     v5: async (creds) =>
       await v5.importResume(
         {
@@ -642,14 +650,13 @@ export async function importResume(
         payload as v4.RxResumeImportPayload,
         toV4Override(creds),
       ),
-  });
+  };
 }
 
-export async function deleteResume(
+function deleteResumeHandlers(
   resumeId: string,
-  options: ResolveModeOptions = {},
-): Promise<void> {
-  await runRxResumeOperation(options, {
+): RxResumeOperationHandlers<void> {
+  return {
     v5: async (creds) => {
       await v5.deleteResume(resumeId, {
         apiKey: creds.apiKey,
@@ -657,14 +664,13 @@ export async function deleteResume(
       });
     },
     v4: async (creds) => await v4.deleteResume(resumeId, toV4Override(creds)),
-  });
+  };
 }
 
-export async function exportResumePdf(
+function exportResumePdfHandlers(
   resumeId: string,
-  options: ResolveModeOptions = {},
-): Promise<string> {
-  return runRxResumeOperation(options, {
+): RxResumeOperationHandlers<string> {
+  return {
     v5: async (creds) =>
       await v5.exportResumePdf(resumeId, {
         apiKey: creds.apiKey,
@@ -672,7 +678,34 @@ export async function exportResumePdf(
       }),
     v4: async (creds) =>
       await v4.exportResumePdf(resumeId, toV4Override(creds)),
-  });
+  };
+}
+
+export type RxResumeSession = {
+  mode: RxResumeResolvedMode;
+  importResume: (payload: RxResumeImportPayload) => Promise<string>;
+  exportResumePdf: (resumeId: string) => Promise<string>;
+  deleteResume: (resumeId: string) => Promise<void>;
+};
+
+/**
+ * Resolve mode and credentials once and reuse them for a sequence of
+ * import/export/delete calls (e.g. one PDF render). v4 logins are shared
+ * through the client token cache, so a session never logs in more than once.
+ */
+export async function openRxResumeSession(
+  options: ResolveModeOptions = {},
+): Promise<RxResumeSession> {
+  const context = await resolveOperationContext(options);
+  return {
+    mode: context.mode,
+    importResume: (payload) =>
+      runWithOperationContext(context, importResumeHandlers(payload)),
+    exportResumePdf: (resumeId) =>
+      runWithOperationContext(context, exportResumePdfHandlers(resumeId)),
+    deleteResume: (resumeId) =>
+      runWithOperationContext(context, deleteResumeHandlers(resumeId)),
+  };
 }
 
 export async function validateCredentials(
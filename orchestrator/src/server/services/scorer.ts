@@ -96,7 +96,7 @@ export async function scoreJobSuitability(
     getEffectiveSettings(),
   ]);
 
-  const prompt = buildScoringPrompt(job, sanitizeProfileForPrompt(profile), {
+  const prompt = buildScoringPrompt(job, getScoringProfileJson(profile), {
     instructions: settings.scoringInstructions?.value ?? "",
     promptTemplate:
       settings.scoringPromptTemplate?.value ??
@@ -254,13 +254,30 @@ export function parseJsonFromContent(
   throw new Error("Unable to parse JSON from model response");
 }
 
+// Scoring runs once per job against the same cached profile object, so keep
+// its pretty-printed prompt block instead of re-serializing it every time.
+const scoringProfileJsonCache = new WeakMap<object, string>();
+
+function getScoringProfileJson(profile: Record<string, unknown>): string {
+  const cached = scoringProfileJsonCache.get(profile);
+  if (cached !== undefined) return cached;
+
+  const profileJson = JSON.stringify(
+    sanitizeProfileForPrompt(profile),
+    null,
+    2,
+  );
+  scoringProfileJsonCache.set(profile, profileJson);
+  return profileJson;
+}
+
 function buildScoringPrompt(
   job: Job,
-  profile: Record<string, unknown>,
+  profileJson: string,
   preferences: ScoringPreferences,
 ): string {
   return renderPromptTemplate(preferences.promptTemplate, {
-    profileJson: JSON.stringify(profile, null, 2),
+    profileJson,
     jobTitle: job.title,
     employer: job.employer,
     location: job.location || "Not specified",
@@ -28,11 +28,13 @@ vi.mock("./writing-style", async (importOriginal) => {
 
 import { getSetting } from "../repositories/settings";
 import { generateTailoring } from "./summary";
+import { clearTailoringCache } from "./tailoring-cache";
 import { getWritingStyle } from "./writing-style";
 
 describe("generateTailoring", () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    clearTailoringCache();
     getProviderMock.mockReturnValue("openrouter");
     getBaseUrlMock.mockReturnValue("https://openrouter.ai");
     callJsonMock.mockResolvedValue({
@@ -119,6 +121,170 @@ describe("generateTailoring", () => {
     );
   });
 
+  it("keeps the profile ahead of the job description in the default prompt", async () => {
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+
+    await generateTailoring("Build APIs", profile);
+    await generateTailoring("Build dashboards", profile);
+
+    const [first, second] = callJsonMock.mock.calls.map(
+      (call) => call[0]?.messages?.[0]?.content as string,
+    );
+    const sharedPrefix = first.slice(0, first.indexOf("Build APIs"));
+    expect(sharedPrefix).toContain('"name": "Test User"');
+    expect(second.startsWith(sharedPrefix)).toBe(true);
+  });
+
+  it("reuses the cached result for an identical tailoring request", async () => {
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+
+    const first = await generateTailoring("Build APIs", profile);
+    const second = await generateTailoring("Build APIs", profile);
+    await generateTailoring("Build dashboards", profile);
+
+    expect(callJsonMock).toHaveBeenCalledTimes(2);
+    expect(second).toEqual(first);
+    expect(second.data).not.toBe(first.data);
+  });
+
+  it("reuses the cached result for a near-duplicate job description", async () => {
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+    const posting = [
+      "We are hiring a senior backend engineer to design, build and operate",
+      "the services behind our payments platform. You will own APIs end to",
+      "end, work closely with product and data teams, mentor other engineers",
+      "and help us scale reliably as transaction volume keeps growing across",
+      "Europe and North America. Experience with TypeScript, Postgres and",
+      "event driven architectures is a strong plus for this remote role.",
+    ].join(" ");
+
+    const scope = { jobTitle: "Senior Backend Engineer", employer: "Acme" };
+
+    await generateTailoring(posting, profile, scope);
+    const relisted = await generateTailoring(
+      posting.replace("remote role", "hybrid role"),
+      profile,
+      scope,
+    );
+    await generateTailoring(
+      posting,
+      { basics: { name: "Other User", label: "Designer" } },
+      scope,
+    );
+
+    expect(relisted.success).toBe(true);
+    expect(callJsonMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("only reuses exact matches when the job title or employer is unknown", async () => {
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+    const posting = [
+      "We are hiring a senior backend engineer to design, build and operate",
+      "the services behind our payments platform. You will own APIs end to",
+      "end, work closely with product and data teams, mentor other engineers",
+      "and help us scale reliably as transaction volume keeps growing.",
+    ].join(" ");
+
+    await generateTailoring(posting, profile);
+    await generateTailoring(`${posting} Remote friendly.`, profile);
+    await generateTailoring(posting, profile, { jobTitle: "Backend Engineer" });
+    await generateTailoring(`${posting} Hybrid.`, profile, {
+      jobTitle: "Backend Engineer",
+    });
+
+    expect(callJsonMock).toHaveBeenCalledTimes(3);
+  });
+
+  it("bypasses the cache for forced regeneration but stores the fresh result", async () => {
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+
+    await generateTailoring("Build APIs", profile);
+    callJsonMock.mockResolvedValueOnce({
+      success: true,
+      data: { summary: "Regenerated", headline: "Senior Engineer", skills: [] },
+    });
+    const forced = await generateTailoring("Build APIs", profile, {
+      bypassCache: true,
+    });
+    const cached = await generateTailoring("Build APIs", profile);
+
+    expect(callJsonMock).toHaveBeenCalledTimes(2);
+    expect(forced.data?.summary).toBe("Regenerated");
+    expect(cached.data?.summary).toBe("Regenerated");
+  });
+
+  it("does not reuse a near-duplicate result across job titles", async () => {
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+    const posting = (role: string) =>
+      [
+        `Acme is hiring a Senior ${role} Engineer to design, build and operate`,
+        "the services behind our payments platform. You will own features end",
+        "to end, work closely with product and data teams, mentor engineers",
+        "and help us scale reliably as transaction volume keeps growing across",
+        "Europe and North America. We offer flexible hours, a learning budget,",
+        "private healthcare and a generous pension for this remote position.",
+      ].join(" ");
+
+    await generateTailoring(posting("Backend"), profile, {
+      jobTitle: "Senior Backend Engineer",
+      employer: "Acme",
+    });
+    await generateTailoring(posting("Frontend"), profile, {
+      jobTitle: "Senior Frontend Engineer",
+      employer: "Acme",
+    });
+
+    expect(callJsonMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("skips near-duplicate hits when regeneration is forced", async () => {
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+    const posting = [
+      "We are hiring a senior backend engineer to design, build and operate",
+      "the services behind our payments platform. You will own APIs end to",
+      "end, work closely with product and data teams, mentor other engineers",
+      "and help us scale reliably as transaction volume keeps growing.",
+    ].join(" ");
+
+    const scope = { jobTitle: "Senior Backend Engineer", employer: "Acme" };
+
+    await generateTailoring(posting, profile, scope);
+    await generateTailoring(`${posting} Remote friendly.`, profile, {
+      ...scope,
+      bypassCache: true,
+    });
+
+    expect(callJsonMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("does not cache failed tailoring calls", async () => {
+    callJsonMock.mockResolvedValueOnce({ success: false, error: "boom" });
+    const profile: ResumeProfile = {
+      basics: { name: "Test User", label: "Engineer" },
+    };
+
+    const failed = await generateTailoring("Build APIs", profile);
+    const retried = await generateTailoring("Build APIs", profile);
+
+    expect(failed.success).toBe(false);
+    expect(retried.success).toBe(true);
+    expect(callJsonMock).toHaveBeenCalledTimes(2);
+  });
+
   it("uses a stored tailoring prompt template override", async () => {
     vi.mocked(getSetting).mockImplementation(async (key) =>
       key === "tailoringPromptTemplate"
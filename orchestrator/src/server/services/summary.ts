@@ -15,6 +15,11 @@ import {
   getEffectivePromptTemplate,
   renderPromptTemplate,
 } from "./prompt-templates";
+import {
+  buildTailoringCacheKey,
+  getCachedTailoring,
+  setCachedTailoring,
+} from "./tailoring-cache";
 import {
   getWritingStyle,
   stripLanguageDirectivesFromConstraints,
@@ -72,28 +77,72 @@ const TAILORING_SCHEMA: JsonSchemaDefinition = {
   },
 };
 
+export interface TailoringOptions {
+  /** Skip cached results (the fresh result is still cached). */
+  bypassCache?: boolean;
+  /**
+   * Near-duplicate cache hits must match the job title and employer; without
+   * both, only exact repeats are served from the cache.
+   */
+  jobTitle?: string | null;
+  employer?: string | null;
+}
+
 /**
  * Generate tailored resume content (summary, headline, skills) for a job.
  */
 export async function generateTailoring(
   jobDescription: string,
   profile: ResumeProfile,
+  options: TailoringOptions = {},
 ): Promise<TailoringResult> {
   const [model, writingStyle] = await Promise.all([
     resolveLlmModel("tailoring"),
     getWritingStyle(),
   ]);
-  const prompt = await buildTailoringPrompt(
+  const renderPrompt = await createTailoringPromptRenderer(
     profile,
-    jobDescription,
     writingStyle,
   );
+  const prompt = renderPrompt(jobDescription);
 
   const llm = new LlmService();
+  const cacheKeyArgs = {
+    provider: llm.getProvider(),
+    baseUrl: llm.getBaseUrl(),
+    model,
+  };
+  const jobTitle = normalizeCacheScope(options.jobTitle);
+  const employer = normalizeCacheScope(options.employer);
+  const cacheLookup = {
+    key: buildTailoringCacheKey({ ...cacheKeyArgs, prompt }),
+    // Without a title and employer, unrelated roles could match on shared
+    // boilerplate, so only exact repeats are reused.
+    contextKey:
+      jobTitle && employer
+        ? buildTailoringCacheKey({
+            ...cacheKeyArgs,
+            prompt: renderPrompt(""),
+            scope: [jobTitle, employer],
+          })
+        : null,
+    jobDescription,
+  };
+  const cached = options.bypassCache ? null : getCachedTailoring(cacheLookup);
+  if (cached) {
+    logger.info("Using cached tailoring result", {
+      model,
+      match: cached.match,
+      similarity: cached.similarity,
+    });
+    return { success: true, data: cached.data };
+  }
+
   const result = await llm.callJson<TailoredData>({
     model,
     messages: [{ role: "user", content: prompt }],
     jsonSchema: TAILORING_SCHEMA,
+    maxRetries: 2,
   });
 
   if (!result.success) {
@@ -116,14 +165,14 @@ export async function generateTailoring(
     logger.warn("AI response missing required tailoring fields", result.data);
   }
 
-  return {
-    success: true,
-    data: {
-      summary: sanitizeText(summary || ""),
-      headline: sanitizeText(headline || ""),
-      skills: skills || [],
-    },
+  const data: TailoredData = {
+    summary: sanitizeText(summary || ""),
+    headline: sanitizeText(headline || ""),
+    skills: skills || [],
   };
+  setCachedTailoring(cacheLookup, data);
+
+  return { success: true, data };
 }
 
 /**
@@ -142,19 +191,13 @@ export async function generateSummary(
   };
 }
 
-async function buildTailoringPrompt(
-  profile: ResumeProfile,
-  jd: string,
-  writingStyle: Awaited<ReturnType<typeof getWritingStyle>>,
-): Promise<string> {
-  const resolvedLanguage = resolveWritingOutputLanguage({
-    style: writingStyle,
-    profile,
-  });
-  const outputLanguage = getWritingLanguageLabel(resolvedLanguage.language);
-  const effectiveConstraints = stripLanguageDirectivesFromConstraints(
-    writingStyle.constraints,
-  );
+// getProfile() hands out one cached profile object, so the pretty-printed
+// prompt block only needs building once per profile rather than once per job.
+const tailoringProfileJsonCache = new WeakMap<ResumeProfile, string>();
+
+function getTailoringProfileJson(profile: ResumeProfile): string {
+  const cached = tailoringProfileJsonCache.get(profile);
+  if (cached !== undefined) return cached;
 
   // Extract only needed parts of profile to save tokens
   const relevantProfile = {
@@ -176,21 +219,47 @@ async function buildTailoringPrompt(
     })),
   };
 
-  const template = await getEffectivePromptTemplate("tailoringPromptTemplate");
+  const profileJson = JSON.stringify(relevantProfile, null, 2);
+  tailoringProfileJsonCache.set(profile, profileJson);
+  return profileJson;
+}
 
-  return renderPromptTemplate(template, {
-    jobDescription: jd,
-    profileJson: JSON.stringify(relevantProfile, null, 2),
-    outputLanguage,
-    tone: writingStyle.tone,
-    formality: writingStyle.formality,
-    constraintsBullet: effectiveConstraints
-      ? `- Additional constraints: ${effectiveConstraints}`
-      : "",
-    avoidTermsBullet: writingStyle.doNotUse
-      ? `- Avoid these words or phrases: ${writingStyle.doNotUse}`
-      : "",
+async function createTailoringPromptRenderer(
+  profile: ResumeProfile,
+  writingStyle: Awaited<ReturnType<typeof getWritingStyle>>,
+): Promise<(jobDescription: string) => string> {
+  const resolvedLanguage = resolveWritingOutputLanguage({
+    style: writingStyle,
+    profile,
   });
+  const outputLanguage = getWritingLanguageLabel(resolvedLanguage.language);
+  const effectiveConstraints = stripLanguageDirectivesFromConstraints(
+    writingStyle.constraints,
+  );
+
+  const template = await getEffectivePromptTemplate("tailoringPromptTemplate");
+  const profileJson = getTailoringProfileJson(profile);
+
+  return (jobDescription) =>
+    renderPromptTemplate(template, {
+      jobDescription,
+      profileJson,
+      outputLanguage,
+      tone: writingStyle.tone,
+      formality: writingStyle.formality,
+      constraintsBullet: effectiveConstraints
+        ? `- Additional constraints: ${effectiveConstraints}`
+        : "",
+      avoidTermsBullet: writingStyle.doNotUse
+        ? `- Avoid these words or phrases: ${writingStyle.doNotUse}`
+        : "",
+    });
+}
+
+function normalizeCacheScope(
+  value: string | null | undefined,
+): string | null {
+  return value?.trim().toLowerCase().replace(/\s+/g, " ") || null;
 }
 
 function sanitizeText(text: string): string {
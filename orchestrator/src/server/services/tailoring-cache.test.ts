@@ -0,0 +1,55 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+import {
+  _getSimilarityIndexSizeForTests,
+  clearTailoringCache,
+  getCachedTailoring,
+  setCachedTailoring,
+} from "./tailoring-cache";
+
+const data = { summary: "Summary", headline: "Engineer", skills: [] };
+
+const lookupFor = (index: number) => ({
+  key: `key-${index}`,
+  contextKey: `context-${index}`,
+  jobDescription: `Build APIs for team ${index} with TypeScript and Postgres`,
+});
+
+describe("tailoring cache", () => {
+  beforeEach(() => {
+    clearTailoringCache();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("drops similarity index rows along with evicted entries", () => {
+    for (let index = 0; index < 600; index++) {
+      setCachedTailoring(lookupFor(index), data);
+    }
+
+    expect(_getSimilarityIndexSizeForTests()).toBe(500);
+    expect(getCachedTailoring(lookupFor(0))).toBeNull();
+    expect(getCachedTailoring(lookupFor(599))?.match).toBe("exact");
+  });
+
+  it("drops similarity index rows for expired entries", () => {
+    vi.useFakeTimers();
+    setCachedTailoring(lookupFor(1), data);
+    setCachedTailoring(lookupFor(2), data);
+
+    vi.advanceTimersByTime(6 * 60 * 60 * 1000);
+    expect(getCachedTailoring(lookupFor(1))).toBeNull();
+
+    expect(_getSimilarityIndexSizeForTests()).toBe(1);
+  });
+
+  it("does not index lookups without a context key", () => {
+    setCachedTailoring({ ...lookupFor(1), contextKey: null }, data);
+
+    expect(_getSimilarityIndexSizeForTests()).toBe(0);
+    expect(
+      getCachedTailoring({ ...lookupFor(1), contextKey: null })?.match,
+    ).toBe("exact");
+  });
+});
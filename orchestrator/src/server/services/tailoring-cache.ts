@@ -0,0 +1,220 @@
+/**
+ * In-memory cache for tailoring results.
+ *
+ * Entries are keyed by the exact LLM request (provider, endpoint, model and
+ * rendered prompt), so identical job descriptions tailored against the same
+ * profile and writing style skip the LLM round-trip entirely.
+ *
+ * On an exact miss, near-duplicate job descriptions (the same posting
+ * re-listed or syndicated across boards) are matched by cosine similarity of
+ * their word-bigram counts, restricted to requests that share everything but
+ * the job description and are for the same job title and employer. Postings
+ * from one employer share boilerplate, so the title keeps e.g. a frontend and
+ * a backend role from reusing each other's headline and skills. Lookups
+ * without a context key are exact-match only. Index rows live and die with
+ * their cached result, so the index is bounded by the cache size.
+ */
+
+import { createHash } from "node:crypto";
+import type { TailoredData } from "./summary";
+
+const TAILORING_CACHE_TTL_MS = 6 * 60 * 60 * 1000;
+const TAILORING_CACHE_MAX_ENTRIES = 500;
+const DEFAULT_SIMILARITY_THRESHOLD = 0.92;
+
+type TailoringCacheEntry = {
+  expiresAt: number;
+  data: TailoredData;
+  contextKey: string | null;
+};
+
+type ShingleVector = {
+  counts: Map<string, number>;
+  norm: number;
+};
+
+type SimilarityEntry = {
+  key: string;
+  vector: ShingleVector;
+};
+
+type TailoringCacheLookup = {
+  /** Exact request key, see buildTailoringCacheKey. */
+  key: string;
+  /**
+   * Key of the same request with the job description left out, or null to
+   * skip near-duplicate matching.
+   */
+  contextKey: string | null;
+  jobDescription: string;
+};
+
+type TailoringCacheHit = {
+  data: TailoredData;
+  match: "exact" | "similar";
+  similarity: number;
+};
+
+const tailoringCache = new Map<string, TailoringCacheEntry>();
+const similarityIndex = new Map<string, SimilarityEntry[]>();
+
+export function buildTailoringCacheKey(args: {
+  provider: string;
+  baseUrl: string;
+  model: string;
+  prompt: string;
+  /** Extra values the key must match on, e.g. job title and employer. */
+  scope?: Array<string | null>;
+}): string {
+  const parts = [args.provider, args.baseUrl, args.model, args.prompt];
+  return createHash("sha256")
+    .update(JSON.stringify(args.scope ? [...parts, args.scope] : parts))
+    .digest("hex");
+}
+
+function resolveSimilarityThreshold(): number {
+  const raw = Number.parseFloat(
+    process.env.TAILORING_CACHE_SIMILARITY_THRESHOLD ?? "",
+  );
+  return Number.isFinite(raw) ? raw : DEFAULT_SIMILARITY_THRESHOLD;
+}
+
+function toShingleVector(text: string): ShingleVector {
+  const words = text.toLowerCase().match(/[\p{L}\p{N}]+/gu) ?? [];
+  const counts = new Map<string, number>();
+  for (let i = 0; i < words.length - 1; i++) {
+    const shingle = `${words[i]} ${words[i + 1]}`;
+    counts.set(shingle, (counts.get(shingle) ?? 0) + 1);
+  }
+
+  let sumOfSquares = 0;
+  for (const count of counts.values()) sumOfSquares += count * count;
+  return { counts, norm: Math.sqrt(sumOfSquares) };
+}
+
+function cosineSimilarity(a: ShingleVector, b: ShingleVector): number {
+  if (a.norm === 0 || b.norm === 0) return 0;
+  const [smaller, larger] =
+    a.counts.size <= b.counts.size
+      ? [a.counts, b.counts]
+      : [b.counts, a.counts];
+  let dot = 0;
+  for (const [shingle, count] of smaller) {
+    dot += count * (larger.get(shingle) ?? 0);
+  }
+  return dot / (a.norm * b.norm);
+}
+
+function removeIndexRow(contextKey: string | null, key: string): void {
+  if (!contextKey) return;
+  const candidates = similarityIndex.get(contextKey);
+  if (!candidates) return;
+  const remaining = candidates.filter((candidate) => candidate.key !== key);
+  if (remaining.length === 0) {
+    similarityIndex.delete(contextKey);
+  } else if (remaining.length !== candidates.length) {
+    similarityIndex.set(contextKey, remaining);
+  }
+}
+
+function deleteEntry(key: string, entry: TailoringCacheEntry): void {
+  tailoringCache.delete(key);
+  removeIndexRow(entry.contextKey, key);
+}
+
+function readEntry(key: string): TailoringCacheEntry | null {
+  const entry = tailoringCache.get(key);
+  if (!entry) return null;
+  if (entry.expiresAt <= Date.now()) {
+    deleteEntry(key, entry);
+    return null;
+  }
+  return entry;
+}
+
+function findSimilarEntry(
+  lookup: TailoringCacheLookup,
+  threshold: number,
+): { entry: TailoringCacheEntry; similarity: number } | null {
+  if (!lookup.contextKey) return null;
+  const candidates = similarityIndex.get(lookup.contextKey);
+  if (!candidates?.length) return null;
+
+  const query = toShingleVector(lookup.jobDescription);
+  let best: { entry: TailoringCacheEntry; similarity: number } | null = null;
+
+  // readEntry drops expired rows from the index, so iterate over a copy.
+  for (const candidate of [...candidates]) {
+    const entry = readEntry(candidate.key);
+    if (!entry) continue;
+    const similarity = cosineSimilarity(query, candidate.vector);
+    if (similarity >= threshold && (!best || similarity > best.similarity)) {
+      best = { entry, similarity };
+    }
+  }
+
+  return best;
+}
+
+export function getCachedTailoring(
+  lookup: TailoringCacheLookup,
+): TailoringCacheHit | null {
+  const exact = readEntry(lookup.key);
+  if (exact) {
+    return {
+      data: structuredClone(exact.data),
+      match: "exact",
+      similarity: 1,
+    };
+  }
+
+  const threshold = resolveSimilarityThreshold();
+  if (threshold > 1) return null;
+
+  const similar = findSimilarEntry(lookup, threshold);
+  if (!similar) return null;
+  return {
+    data: structuredClone(similar.entry.data),
+    match: "similar",
+    similarity: similar.similarity,
+  };
+}
+
+export function setCachedTailoring(
+  lookup: TailoringCacheLookup,
+  data: TailoredData,
+): void {
+  const previous = tailoringCache.get(lookup.key);
+  if (previous) deleteEntry(lookup.key, previous);
+  tailoringCache.set(lookup.key, {
+    expiresAt: Date.now() + TAILORING_CACHE_TTL_MS,
+    data: structuredClone(data),
+    contextKey: lookup.contextKey,
+  });
+
+  // Map iteration follows insertion order, so the first entry is the oldest.
+  while (tailoringCache.size > TAILORING_CACHE_MAX_ENTRIES) {
+    const oldest = tailoringCache.entries().next().value;
+    if (oldest === undefined) break;
+    deleteEntry(oldest[0], oldest[1]);
+  }
+
+  if (!lookup.contextKey) return;
+  const candidates = similarityIndex.get(lookup.contextKey) ?? [];
+  candidates.push({
+    key: lookup.key,
+    vector: toShingleVector(lookup.jobDescription),
+  });
+  similarityIndex.set(lookup.contextKey, candidates);
+}
+
+export function clearTailoringCache(): void {
+  tailoringCache.clear();
+  similarityIndex.clear();
+}
+
+export function _getSimilarityIndexSizeForTests(): number {
+  let rows = 0;
+  for (const candidates of similarityIndex.values()) rows += candidates.length;
+  return rows;
+}
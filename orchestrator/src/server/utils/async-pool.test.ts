@@ -1,5 +1,5 @@
 import { describe, expect, it } from "vitest";
-import { asyncPool } from "./async-pool";
+import { asyncPool, createConcurrencyLimiter } from "./async-pool";
 
 describe("asyncPool", () => {
   it("preserves input order in output", async () => {
@@ -124,3 +124,40 @@ describe("asyncPool", () => {
     expect(result).toEqual([2, 4]);
   });
 });
+
+describe("createConcurrencyLimiter", () => {
+  it("caps in-flight tasks and runs queued tasks in submission order", async () => {
+    const limit = createConcurrencyLimiter(2);
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const started: number[] = [];
+
+    const results = await Promise.all(
+      [1, 2, 3, 4, 5].map((item) =>
+        limit(async () => {
+          started.push(item);
+          inFlight += 1;
+          maxInFlight = Math.max(maxInFlight, inFlight);
+          await new Promise((resolve) => setTimeout(resolve, 2));
+          inFlight -= 1;
+          return item * 10;
+        }),
+      ),
+    );
+
+    expect(results).toEqual([10, 20, 30, 40, 50]);
+    expect(started).toEqual([1, 2, 3, 4, 5]);
+    expect(maxInFlight).toBe(2);
+  });
+
+  it("releases the slot when a task fails", async () => {
+    const limit = createConcurrencyLimiter(1);
+
+    await expect(
+      limit(async () => {
+        throw new Error("boom");
+      }),
+    ).rejects.toThrow("boom");
+    await expect(limit(async () => "ok")).resolves.toBe("ok");
+  });
+});
@@ -2,6 +2,11 @@ type AsyncPoolTaskStatus<TResult> =
   | { status: "fulfilled"; result: TResult }
   | { status: "rejected"; error: unknown };
 
+function toSafeConcurrency(concurrency: number): number {
+  const rawConcurrency = Number.isFinite(concurrency) ? concurrency : 1;
+  return Math.max(1, Math.min(10, Math.floor(rawConcurrency)));
+}
+
 export async function asyncPool<TItem, TResult>(args: {
   items: readonly TItem[];
   concurrency: number;
@@ -15,10 +20,7 @@ export async function asyncPool<TItem, TResult>(args: {
   ) => void;
 }): Promise<TResult[]> {
   const { items, task, shouldStop, onTaskStarted, onTaskSettled } = args;
-  const rawConcurrency = Number.isFinite(args.concurrency)
-    ? args.concurrency
-    : 1;
-  const safeConcurrency = Math.max(1, Math.min(10, Math.floor(rawConcurrency)));
+  const safeConcurrency = toSafeConcurrency(args.concurrency);
 
   if (items.length === 0) return [];
 
@@ -85,3 +87,32 @@ export async function asyncPool<TItem, TResult>(args: {
 
   return results.filter((value): value is TResult => value !== UNSET);
 }
+
+/**
+ * Returns a function that runs tasks as they are submitted, with at most
+ * `concurrency` of them in flight; extra tasks wait in FIFO order.
+ */
+export function createConcurrencyLimiter(
+  concurrency: number,
+): <TResult>(task: () => Promise<TResult>) => Promise<TResult> {
+  const limit = toSafeConcurrency(concurrency);
+  const waiting: Array<() => void> = [];
+  let active = 0;
+
+  return async (task) => {
+    if (active < limit) {
+      active += 1;
+    } else {
+      await new Promise<void>((resolve) => waiting.push(resolve));
+    }
+
+    try {
+      return await task();
+    } finally {
+      // Hand the slot straight to the next waiter, if any.
+      const next = waiting.shift();
+      if (next) next();
+      else active -= 1;
+    }
+  };
+}
@@ -0,0 +1,21 @@
+import { describe, expect, it } from "vitest";
+import { discardResponseBody } from "./fetch";
+
+describe("discardResponseBody", () => {
+  it("consumes an unread body", async () => {
+    const response = new Response("ignored");
+
+    await discardResponseBody(response);
+
+    expect(response.bodyUsed).toBe(true);
+  });
+
+  it("ignores responses without a body or with a consumed body", async () => {
+    const empty = new Response(null, { status: 204 });
+    const consumed = new Response("already read");
+    await consumed.text();
+
+    await expect(discardResponseBody(empty)).resolves.toBeUndefined();
+    await expect(discardResponseBody(consumed)).resolves.toBeUndefined();
+  });
+});
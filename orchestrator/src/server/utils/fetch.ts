@@ -0,0 +1,12 @@
+/**
+ * Read and discard a fetch response body.
+ *
+ * Undici only returns a keep-alive socket to its pool once the body has been
+ * consumed; a response whose body is never read holds the connection until
+ * it is garbage collected, so the next request to the same host pays for a
+ * fresh TCP/TLS handshake.
+ */
+export async function discardResponseBody(response: Response): Promise<void> {
+  if (!response.body || response.bodyUsed) return;
+  await response.arrayBuffer().catch(() => undefined);
+}
@@ -42,12 +42,12 @@ Writing style formality: {{formality}}.
 You are an expert resume writer tailoring a profile for a specific job application.
 You must return a JSON object with three fields: "headline", "summary", and "skills".
 
-JOB DESCRIPTION (JD):
-{{jobDescription}}
-
 MY PROFILE:
 {{profileJson}}
 
+JOB DESCRIPTION (JD):
+{{jobDescription}}
+
 INSTRUCTIONS:
 
 1. "headline" (String):
@@ -0,0 +1,38 @@
+import { describe, expect, it, vi } from "vitest";
+import { blockHeavyResources } from "./browser";
+
+describe("blockHeavyResources", () => {
+  it("aborts images, fonts and media and lets other requests through", async () => {
+    let handler: Parameters<
+      Parameters<typeof blockHeavyResources>[0]["route"]
+    >[1] = async () => undefined;
+    await blockHeavyResources({
+      route: async (_url, routeHandler) => {
+        handler = routeHandler;
+      },
+    });
+
+    const types = ["document", "script", "xhr", "image", "font", "media"];
+    const outcomes: Record<string, string> = {};
+    for (const type of types) {
+      await handler({
+        request: () => ({ resourceType: () => type }),
+        abort: vi.fn(async () => {
+          outcomes[type] = "abort";
+        }),
+        continue: vi.fn(async () => {
+          outcomes[type] = "continue";
+        }),
+      });
+    }
+
+    expect(outcomes).toEqual({
+      document: "continue",
+      script: "continue",
+      xhr: "continue",
+      image: "abort",
+      font: "abort",
+      media: "abort",
+    });
+  });
+});
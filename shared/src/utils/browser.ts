@@ -0,0 +1,50 @@
+/**
+ * Browser helpers shared by the Playwright-based extractors.
+ *
+ * Typed structurally so this package does not depend on Playwright; a
+ * Playwright `BrowserContext` or `Page` satisfies `RoutableTarget`.
+ */
+
+/**
+ * Firefox prefs that skip startup work a scraping browser never needs:
+ * telemetry, update and safe-browsing checks, crash-session restore and the
+ * default home/new-tab pages.
+ */
+export const FIREFOX_USER_PREFS: Record<string, boolean | string> = {
+  "toolkit.telemetry.enabled": false,
+  "app.update.enabled": false,
+  "browser.safebrowsing.malware.enabled": false,
+  "browser.safebrowsing.phishing.enabled": false,
+  "browser.sessionstore.resume_from_crash": false,
+  "browser.startup.homepage": "about:blank",
+  "browser.newtabpage.enabled": false,
+};
+
+const HEAVY_RESOURCE_TYPES = new Set(["image", "font", "media"]);
+
+type RoutedRequest = {
+  request(): { resourceType(): string };
+  abort(): Promise<void>;
+  continue(): Promise<void>;
+};
+
+type RoutableTarget = {
+  route(
+    url: string,
+    handler: (route: RoutedRequest) => Promise<void>,
+  ): Promise<void>;
+};
+
+/**
+ * Aborts image, font and media requests. Extractors read job data from page
+ * markup or JSON APIs, so these only slow down navigation.
+ */
+export async function blockHeavyResources(
+  target: RoutableTarget,
+): Promise<void> {
+  await target.route("**/*", (route) =>
+    HEAVY_RESOURCE_TYPES.has(route.request().resourceType())
+      ? route.abort()
+      : route.continue(),
+  );
+}
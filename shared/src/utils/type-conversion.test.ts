@@ -0,0 +1,33 @@
+import { describe, expect, it } from "vitest";
+import { parsePositiveInt, toBooleanOrNull } from "./type-conversion";
+
+describe("toBooleanOrNull", () => {
+  it("parses common truthy and falsy spellings", () => {
+    expect(toBooleanOrNull("Yes")).toBe(true);
+    expect(toBooleanOrNull(" on ")).toBe(true);
+    expect(toBooleanOrNull("0")).toBe(false);
+    expect(toBooleanOrNull("off")).toBe(false);
+    expect(toBooleanOrNull(1)).toBe(true);
+    expect(toBooleanOrNull(false)).toBe(false);
+  });
+
+  it("returns null for missing or unrecognised values", () => {
+    expect(toBooleanOrNull(undefined)).toBeNull();
+    expect(toBooleanOrNull("")).toBeNull();
+    expect(toBooleanOrNull("maybe")).toBeNull();
+    expect(toBooleanOrNull({})).toBeNull();
+  });
+});
+
+describe("parsePositiveInt", () => {
+  it("parses positive integers", () => {
+    expect(parsePositiveInt("25", 10)).toBe(25);
+  });
+
+  it("falls back for missing, invalid, or non-positive input", () => {
+    expect(parsePositiveInt(undefined, 10)).toBe(10);
+    expect(parsePositiveInt("abc", 10)).toBe(10);
+    expect(parsePositiveInt("0", 10)).toBe(10);
+    expect(parsePositiveInt("-3", 10)).toBe(10);
+  });
+});
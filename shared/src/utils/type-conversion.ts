@@ -41,3 +41,35 @@ export function toNumberOrNull(value: unknown): number | null {
   }
   return null;
 }
+
+/**
+ * Converts a value to a boolean or null.
+ * - Returns booleans as-is and treats non-zero numbers as true
+ * - Accepts "1"/"true"/"yes"/"y"/"on" and "0"/"false"/"no"/"n"/"off" (case-insensitive)
+ * - Returns null for null, undefined, empty strings, and anything else
+ */
+export function toBooleanOrNull(value: unknown): boolean | null {
+  if (value === null || value === undefined) return null;
+  if (typeof value === "boolean") return value;
+  if (typeof value === "number") return value !== 0;
+  if (typeof value === "string") {
+    const normalized = value.trim().toLowerCase();
+    if (!normalized) return null;
+    if (["1", "true", "yes", "y", "on"].includes(normalized)) return true;
+    if (["0", "false", "no", "n", "off"].includes(normalized)) return false;
+  }
+  return null;
+}
+
+/**
+ * Parses a positive integer setting, typically from an environment variable.
+ * - Returns the fallback when the input is missing, not an integer, or below 1
+ */
+export function parsePositiveInt(
+  input: string | undefined,
+  fallback: number,
+): number {
+  const parsed = input ? Number.parseInt(input, 10) : Number.NaN;
+  if (!Number.isFinite(parsed) || parsed < 1) return fallback;
+  return parsed;
+}